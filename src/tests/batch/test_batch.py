@@ -1,3 +1,5 @@
+import queue
+from threading import Thread as RealThread
 from unittest.mock import MagicMock, call, ANY
 
 import pytest
@@ -158,4 +160,60 @@ def test_flush_batch_reconnects_if_disconnected(mock_deps):
     # Should try to reconnect
     mock_deps["get_client"].assert_called_once()
     # And then send
-    mock_deps["client"].batch.dynamic.assert_called_once()
\ No newline at end of file
+    mock_deps["client"].batch.dynamic.assert_called_once()
+
+
+def test_flush_waits_for_queued_items(mock_deps):
+    """
+    Case 7: flush() returns once the worker has sent everything queued before the call
+    """
+    manager = get_batch_manager()
+    manager.flush_interval = 3600  # Only the flush request may trigger a send
+    worker = RealThread(target=manager._worker_loop, daemon=True)
+    manager._worker_thread = worker
+    worker.start()
+
+    try:
+        manager.add_object(collection="C1", properties={"p": 1}, uuid="u1")
+        manager.add_object(collection="C1", properties={"p": 2}, uuid="u2")
+
+        assert manager.flush(timeout=5) is True
+        assert mock_deps["batch_context"].add_object.call_count == 2
+        assert manager.queue.empty()
+    finally:
+        manager._stop_event.set()
+        worker.join(timeout=2)
+
+
+def test_flush_returns_false_after_shutdown(mock_deps):
+    manager = get_batch_manager()
+    manager._stop_event.set()
+
+    assert manager.flush(timeout=0.1) is False
+
+
+def test_worker_flushes_buffered_items_on_stop(mock_deps):
+    """
+    Case 8: Items the worker already buffered are sent when shutdown stops the loop
+    """
+    manager = get_batch_manager()
+    manager.flush_interval = 3600
+    item = {"collection": "C1", "properties": {"p": 1}, "uuid": "u1", "vector": None}
+
+    # Hands out one item, then requests the stop while it is still buffered
+    stub_queue = MagicMock()
+
+    def get_then_stop(timeout):
+        if stub_queue.get.call_count == 1:
+            return item
+        manager._stop_event.set()
+        raise queue.Empty
+
+    stub_queue.get.side_effect = get_then_stop
+    manager.queue = stub_queue
+
+    manager._worker_loop()  # Runs in the test thread and returns once the stop is seen
+
+    mock_deps["batch_context"].add_object.assert_called_once_with(
+        collection="C1", properties={"p": 1}, uuid="u1", vector=None
+    )
@@ -25,3 +25,4 @@ def atomic_function_cache():
 
     # --- TEARDOWN (After Test) ---
     _delete_cache()
+
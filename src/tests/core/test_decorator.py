@@ -342,4 +342,193 @@ def test_vectorize_handles_tags_when_no_props_file(mock_decorator_deps_no_props)
     assert props["status"] == "SUCCESS"
 
     # 3b. The tag should NOT exist
-    assert "team" not in props
\ No newline at end of file
+    assert "team" not in props
+
+
+def test_vectorize_batch_embeds_inputs_in_one_call(mock_decorator_deps, monkeypatch):
+    """
+    Case 8: Test that .batch() embeds every call's input with a single
+    embed_batch call and logs each execution with its own vector
+    """
+    mock_batch = mock_decorator_deps["batch"]
+    mock_settings = mock_decorator_deps["settings"]
+
+    mock_vectorizer = MagicMock()
+    mock_vectorizer.embed_batch.side_effect = lambda texts: [[float(i)] for i in range(len(texts))]
+    monkeypatch.setattr("vectorwave.core.decorator.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+    monkeypatch.setattr("vectorwave.monitoring.tracer.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+
+    @vectorize(search_description="Batch test", capture_return_value=True)
+    def my_batch_function(query: str):
+        return f"Answer: {query}"
+
+    mock_batch.add_object.reset_mock()
+    mock_vectorizer.embed.reset_mock()
+
+    results = my_batch_function.batch(query=["a", "b", "c"])
+
+    assert results == ["Answer: a", "Answer: b", "Answer: c"]
+    mock_vectorizer.embed_batch.assert_called_once()
+    mock_vectorizer.embed.assert_not_called()
+
+    logged = [c.kwargs for c in mock_batch.add_object.call_args_list
+              if c.kwargs["collection"] == mock_settings.EXECUTION_COLLECTION_NAME]
+    assert [c["vector"] for c in logged] == [[0.0], [1.0], [2.0]]
+
+
+def test_vectorize_batch_rejects_uneven_lists(mock_decorator_deps):
+    @vectorize(search_description="Batch test")
+    def my_uneven_function(a, b):
+        return a + b
+
+    with pytest.raises(ValueError):
+        my_uneven_function.batch(a=[1, 2], b=[1])
+
+
+@pytest.mark.asyncio
+async def test_vectorize_async_batch_gathers_calls(mock_decorator_deps, monkeypatch):
+    """
+    Case 9: Async .batch() embeds once and runs the calls concurrently, keeping input order
+    """
+    import asyncio
+
+    mock_vectorizer = MagicMock()
+    mock_vectorizer.embed_batch.side_effect = lambda texts: [[float(i)] for i in range(len(texts))]
+    monkeypatch.setattr("vectorwave.core.decorator.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+    monkeypatch.setattr("vectorwave.monitoring.tracer.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+
+    queries = ["a", "b", "c"]
+    started = []
+    all_started = asyncio.Event()
+
+    @vectorize(search_description="Async batch test", capture_return_value=True)
+    async def my_async_batch_function(query: str):
+        # Only opens once every call is in flight, so sequential execution would never finish
+        started.append(query)
+        if len(started) == len(queries):
+            all_started.set()
+        await all_started.wait()
+        return f"Answer: {query}"
+
+    mock_vectorizer.embed.reset_mock()
+
+    results = await asyncio.wait_for(my_async_batch_function.batch(query=queries), timeout=5)
+
+    assert results == ["Answer: a", "Answer: b", "Answer: c"]
+    mock_vectorizer.embed_batch.assert_called_once()
+    mock_vectorizer.embed.assert_not_called()
+
+
+def test_vectorize_embed_predicate_skips_input_embedding(mock_decorator_deps, monkeypatch):
+    """
+    Case 10: Calls rejected by embed_predicate are logged without an input vector
+    """
+    mock_batch = mock_decorator_deps["batch"]
+    mock_settings = mock_decorator_deps["settings"]
+
+    mock_vectorizer = MagicMock()
+    mock_vectorizer.embed.return_value = [0.5]
+    monkeypatch.setattr("vectorwave.core.decorator.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+    monkeypatch.setattr("vectorwave.monitoring.tracer.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+
+    @vectorize(search_description="Predicate test", capture_return_value=True,
+               embed_predicate=lambda query: len(query) > 3)
+    def my_predicate_function(query: str):
+        return query.upper()
+
+    mock_batch.add_object.reset_mock()
+    mock_vectorizer.embed.reset_mock()
+
+    assert my_predicate_function(query="hi") == "HI"
+    assert my_predicate_function(query="hello") == "HELLO"
+
+    assert mock_vectorizer.embed.call_count == 1
+    logged = [c.kwargs for c in mock_batch.add_object.call_args_list
+              if c.kwargs["collection"] == mock_settings.EXECUTION_COLLECTION_NAME]
+    assert [c["vector"] for c in logged] == [None, [0.5]]
+
+
+def test_vectorize_exposes_execution_log_uuid(mock_decorator_deps):
+    """
+    Case 11: The execution log is written under the span id, readable via get_last_execution_uuid()
+    """
+    from vectorwave import get_last_execution_uuid
+
+    mock_batch = mock_decorator_deps["batch"]
+    mock_settings = mock_decorator_deps["settings"]
+
+    @vectorize(search_description="UUID test")
+    def my_uuid_function(x):
+        return x
+
+    mock_batch.add_object.reset_mock()
+    my_uuid_function(x=1)
+
+    logged = [c.kwargs for c in mock_batch.add_object.call_args_list
+              if c.kwargs["collection"] == mock_settings.EXECUTION_COLLECTION_NAME]
+    assert len(logged) == 1
+    assert logged[0]["uuid"] == logged[0]["properties"]["span_id"]
+    assert get_last_execution_uuid() == logged[0]["uuid"]
+
+
+def test_vectorize_batch_embeds_when_predicate_raises(mock_decorator_deps, monkeypatch):
+    """A failing embed_predicate warns and embeds anyway, in .batch() as in single calls"""
+    mock_vectorizer = MagicMock()
+    mock_vectorizer.embed_batch.side_effect = lambda texts: [[float(i)] for i in range(len(texts))]
+    monkeypatch.setattr("vectorwave.core.decorator.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+    monkeypatch.setattr("vectorwave.monitoring.tracer.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+
+    def broken_predicate(query):
+        raise RuntimeError("boom")
+
+    @vectorize(search_description="Broken predicate", capture_return_value=True, embed_predicate=broken_predicate)
+    def my_broken_predicate_function(query: str):
+        return query
+
+    assert my_broken_predicate_function.batch(query=["a", "b"]) == ["a", "b"]
+    assert len(mock_vectorizer.embed_batch.call_args.args[0]) == 2
+
+
+def test_vectorize_cache_hit_clears_execution_log_uuid(mock_decorator_deps, monkeypatch):
+    """A call served from the cache writes no execution log, so the last UUID is reset to None"""
+    from vectorwave import get_last_execution_uuid
+
+    mock_vectorizer = MagicMock()
+    monkeypatch.setattr("vectorwave.core.decorator.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+    monkeypatch.setattr("vectorwave.monitoring.tracer.get_vectorizer", MagicMock(return_value=mock_vectorizer))
+
+    @vectorize(search_description="UUID test")
+    def my_uuid_function(x):
+        return x
+
+    @vectorize(search_description="Cached UUID test", semantic_cache=True, cache_threshold=0.9)
+    def my_cached_function(x):
+        return x
+
+    my_uuid_function(x=1)
+    assert get_last_execution_uuid() is not None
+
+    monkeypatch.setattr("vectorwave.core.decorator._lookup_cached_result",
+                        MagicMock(return_value=("cached", None)))
+    assert my_cached_function(x=1) == "cached"
+    assert get_last_execution_uuid() is None
+
+
+@pytest.mark.asyncio
+async def test_vectorize_async_exposes_execution_log_uuid(mock_decorator_deps):
+    from vectorwave import get_last_execution_uuid
+
+    mock_batch = mock_decorator_deps["batch"]
+    mock_settings = mock_decorator_deps["settings"]
+
+    @vectorize(search_description="Async UUID test")
+    async def my_async_uuid_function(x):
+        return x
+
+    mock_batch.add_object.reset_mock()
+    await my_async_uuid_function(x=1)
+
+    logged = [c.kwargs for c in mock_batch.add_object.call_args_list
+              if c.kwargs["collection"] == mock_settings.EXECUTION_COLLECTION_NAME]
+    assert len(logged) == 1
+    assert get_last_execution_uuid() == logged[0]["uuid"]
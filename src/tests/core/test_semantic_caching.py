@@ -56,6 +56,7 @@ def mock_caching_deps(monkeypatch):
     mock_response.objects = []  # Default to no golden hit
 
     mock_query.near_vector.return_value = mock_response
+    mock_query.fetch_objects.return_value = mock_response  # No SimHash prefilter match by default
     mock_collection.query = mock_query
     mock_client.collections.get.return_value = mock_collection
 
@@ -150,6 +151,7 @@ def test_cache_miss_and_log_saving(mock_caching_deps):
     assert kwargs["collection"] == mock_caching_deps["settings"].EXECUTION_COLLECTION_NAME
     assert kwargs["properties"]["status"] == "SUCCESS"
     assert kwargs["vector"] == mock_vectorizer.embed.return_value # Check if input vector was saved
+    assert "input_digest" not in kwargs["properties"] # Digest prefilter is off by default
 
     # 5. Verification: Check that the return value was logged and sensitive data was masked
     logged_return = json.loads(kwargs["properties"]["return_value"])
@@ -340,6 +342,26 @@ def test_cache_disabled_when_vectorizer_is_none(mock_search_cache, mock_caching_
             mock_caching_deps["batch"].add_object.assert_called()
 
 
+def test_cache_check_skipped_when_threshold_is_zero(mock_caching_deps):
+    """
+    Test 7: A falsy cache_threshold can never hit, so the decorator should not call the cache check at all.
+    """
+    with patch('vectorwave.core.decorator._lookup_cached_result') as mock_check:
+        @vectorize(
+            search_description="Test Zero Threshold",
+            sequence_narrative="Cache Test",
+            semantic_cache=True,
+            cache_threshold=0.0
+        )
+        def my_zero_threshold_func(x):
+            return x * 2
+
+        result = my_zero_threshold_func(x=21)
+
+    assert result == 42
+    mock_check.assert_not_called()
+
+
 def test_tracer_input_vector_data_and_masking(mock_caching_deps):
     """
     Tests that the _create_input_vector_data function masks sensitive keys.
@@ -369,4 +391,127 @@ def test_tracer_input_vector_data_and_masking(mock_caching_deps):
     props = input_data["properties"]
     assert props["function"] == "test_func"
     assert props["kwargs"]["amount"] == 100
-    assert props["kwargs"]["secret_key"] == "[MASKED]"
\ No newline at end of file
+    assert props["kwargs"]["secret_key"] == "[MASKED]"
+
+
+def test_identical_calls_served_from_exact_match_memo(mock_caching_deps, monkeypatch):
+    """
+    Repeated calls with identical arguments are answered from the exact-match memo:
+    the function runs once and later calls skip embedding and vector search, but still log CACHE_HIT.
+    """
+    mock_batch = mock_caching_deps["batch"]
+    mock_vectorizer = mock_caching_deps["vectorizer"]
+    mock_search = mock_caching_deps["search_cache"]
+    mock_search.return_value = None
+    monkeypatch.setattr("vectorwave.utils.return_caching_utils.get_batch_manager", MagicMock(return_value=mock_batch))
+    monkeypatch.setattr(mock_caching_deps["settings"], "CACHE_EXACT_MEMO_TTL_SECONDS", 300.0)
+
+    mock_func = MagicMock(return_value={"status": "NEW_RUN", "secret_key": "abc"})
+
+    @vectorize(search_description="Exact memo", semantic_cache=True, cache_threshold=0.9)
+    def my_memo_func(user_query, amount):
+        return mock_func(user_query, amount)
+
+    assert my_memo_func(user_query="same", amount=100) == {"status": "NEW_RUN", "secret_key": "abc"}
+
+    mock_vectorizer.embed.reset_mock()
+    mock_search.reset_mock()
+    mock_batch.add_object.reset_mock()
+
+    results = [my_memo_func(user_query="same", amount=100) for _ in range(3)]
+
+    mock_func.assert_called_once()
+    mock_vectorizer.embed.assert_not_called()
+    mock_search.assert_not_called()
+    # Served values go through the same masking/serialization as semantic cache hits
+    assert results == [{"status": "NEW_RUN", "secret_key": "[MASKED]"}] * 3
+    statuses = [c.kwargs["properties"]["status"] for c in mock_batch.add_object.call_args_list]
+    assert statuses == ["CACHE_HIT"] * 3
+
+    # Different arguments still go through the semantic cache
+    my_memo_func(user_query="other", amount=100)
+    mock_search.assert_called_once()
+
+
+def test_exact_match_memo_respects_types_and_replay(mock_caching_deps, monkeypatch):
+    """
+    1 / True are different memo keys, and REPLAY executions bypass the memo.
+    """
+    from vectorwave.utils.context import execution_source_context
+
+    mock_caching_deps["search_cache"].return_value = None
+    monkeypatch.setattr("vectorwave.utils.return_caching_utils.get_batch_manager",
+                        MagicMock(return_value=mock_caching_deps["batch"]))
+    monkeypatch.setattr(mock_caching_deps["settings"], "CACHE_EXACT_MEMO_TTL_SECONDS", 300.0)
+    mock_func = MagicMock(side_effect=lambda x: repr(x))
+
+    @vectorize(search_description="Typed memo", semantic_cache=True, cache_threshold=0.9)
+    def my_typed_func(x):
+        return mock_func(x)
+
+    assert my_typed_func(x=1) == "1"
+    assert my_typed_func(x=True) == "True"
+    assert mock_func.call_count == 2
+
+    token = execution_source_context.set("REPLAY")
+    try:
+        my_typed_func(x=1)
+    finally:
+        execution_source_context.reset(token)
+    assert mock_func.call_count == 3
+
+
+def test_exact_match_memo_expires_and_invalidates(monkeypatch):
+    from vectorwave.utils import return_caching_utils as rcu
+
+    now = [100.0]
+    monkeypatch.setattr(rcu.time, "monotonic", lambda: now[0])
+
+    memo = rcu._ExactMatchCache(ttl_seconds=10.0)
+    key = memo.make_key((), {"q": "same"})
+    memo.put(key, {"return_value": '"v"', "uuid": None}, False)
+    assert memo.get(key) is not None
+
+    now[0] += 11.0
+    assert memo.get(key) is None
+
+    memo.put(key, {"return_value": '"v"', "uuid": None}, False)
+    rcu.invalidate_exact_caches()
+    assert memo.get(key) is None
+
+
+def test_input_digest_stored_on_span_when_prefilter_enabled(mock_caching_deps, monkeypatch):
+    """
+    The span stores the digest of the user's arguments (not the injected tags),
+    so it matches the digest the cache lookup computes for the same call.
+    """
+    from vectorwave.utils.input_digest import input_digest64
+
+    mock_batch = mock_caching_deps["batch"]
+    mock_caching_deps["search_cache"].return_value = None
+    monkeypatch.setattr(mock_caching_deps["settings"], "CACHE_INPUT_DIGEST_PREFILTER", True)
+
+    @vectorize(search_description="Digest", sequence_narrative="Digest", semantic_cache=True, cache_threshold=0.9)
+    def my_digest_func(user_id, amount):
+        return {"ok": amount}
+
+    mock_batch.add_object.reset_mock()
+    my_digest_func(user_id="user_X", amount=100)
+
+    props = mock_batch.add_object.call_args.kwargs["properties"]
+    assert props["input_digest"] == input_digest64("Function Context: my_digest_func user_id: user_X amount: 100")
+
+
+def test_exact_match_memo_is_off_by_default(mock_caching_deps):
+    """Without CACHE_EXACT_MEMO_TTL_SECONDS every repeated call goes through the traced semantic cache path"""
+    mock_search = mock_caching_deps["search_cache"]
+    mock_search.return_value = None
+
+    @vectorize(search_description="No memo", semantic_cache=True, cache_threshold=0.9)
+    def my_unmemoized_func(x):
+        return {"x": x}
+
+    my_unmemoized_func(x=1)
+    my_unmemoized_func(x=1)
+
+    assert mock_search.call_count == 2
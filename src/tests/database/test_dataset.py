@@ -94,4 +94,142 @@ def test_recommend_candidates_logic(mock_dataset_deps):
     assert recommendations[0]["uuid"] == "cand-a"
     assert recommendations[0]["type"] == "STEADY"
     assert recommendations[1]["uuid"] == "cand-b"
-    assert recommendations[1]["type"] == "DISCOVERY"
\ No newline at end of file
+    assert recommendations[1]["type"] == "DISCOVERY"
+
+
+def test_recommend_candidates_skips_golden_and_respects_limit(mock_dataset_deps):
+    """[Case 3] Already-golden logs are excluded and results stop at 'limit'"""
+    manager = VectorWaveDatasetManager()
+
+    golden_objs = [
+        create_mock_obj("gold-1", {"original_uuid": "cand-a"}, [1.0, 1.0]),
+        create_mock_obj("gold-2", {"original_uuid": "origin-2"}, [1.0, 1.0]),
+    ]
+    mock_dataset_deps["golden_col"].query.fetch_objects.return_value.objects = golden_objs
+
+    cands = [create_mock_obj(f"cand-{c}", {"return_value": c}, [1.01, 1.01]) for c in "abcd"]
+    mock_dataset_deps["exec_col"].query.near_vector.return_value.objects = cands
+
+    recommendations = manager.recommend_candidates("test_func", limit=2)
+
+    assert [r["uuid"] for r in recommendations] == ["cand-b", "cand-c"]
+    assert all(r["type"] == "STEADY" for r in recommendations)
+    assert isinstance(recommendations[0]["distance_to_center"], float)
+    assert recommendations[0]["distance_to_center"] == pytest.approx(math.dist([1.01, 1.01], [1.0, 1.0]), abs=1e-6)
+
+
+def test_recommend_candidates_caches_golden_stats_until_register(mock_dataset_deps):
+    """[Case 4] Golden vectors are fetched once and refetched after a new registration"""
+    manager = VectorWaveDatasetManager()
+
+    golden_objs = [create_mock_obj("gold-1", {"original_uuid": "origin-1"}, [1.0, 1.0])]
+    fetch_objects = mock_dataset_deps["golden_col"].query.fetch_objects
+    fetch_objects.return_value.objects = golden_objs
+    mock_dataset_deps["exec_col"].query.near_vector.return_value.objects = [
+        create_mock_obj("cand-a", {"return_value": "A"}, [1.05, 1.05])
+    ]
+
+    manager.recommend_candidates("test_func")
+    manager.recommend_candidates("test_func")
+    assert fetch_objects.call_count == 1
+
+    mock_dataset_deps["exec_col"].query.fetch_object_by_id.return_value = create_mock_obj(
+        "log-uuid-2", {"function_name": "test_func"}, vector=[1.1, 1.1]
+    )
+    assert manager.register_as_golden("log-uuid-2") is True
+
+    manager.recommend_candidates("test_func")
+    assert fetch_objects.call_count == 2
+
+
+def test_recommend_candidates_reuses_candidate_distances(mock_dataset_deps):
+    """[Case 5] Distances are computed once per candidate until the golden set changes"""
+    manager = VectorWaveDatasetManager()
+
+    mock_dataset_deps["golden_col"].query.fetch_objects.return_value.objects = [
+        create_mock_obj("gold-1", {"original_uuid": "origin-1"}, [1.0, 1.0])
+    ]
+    near_vector = mock_dataset_deps["exec_col"].query.near_vector
+    near_vector.return_value.objects = [create_mock_obj("cand-a", {"return_value": "A"}, [1.05, 1.05])]
+
+    first = manager.recommend_candidates("test_func")
+    assert set(manager._distance_cache["test_func"]) == {"cand-a"}
+
+    # Mark cand-a's cached entry: a reused entry is served as-is instead of being recomputed
+    manager._distance_cache["test_func"]["cand-a"] = (0.01, 0.02)
+
+    # A new candidate arrives: only its distances are computed
+    near_vector.return_value.objects = [
+        create_mock_obj("cand-a", {"return_value": "A"}, [1.05, 1.05]),
+        create_mock_obj("cand-b", {"return_value": "B"}, [1.2, 1.2]),
+    ]
+    second = manager.recommend_candidates("test_func")
+
+    assert first[0]["distance_to_center"] == pytest.approx(math.dist([1.05, 1.05], [1.0, 1.0]), abs=1e-6)
+    assert second[0]["distance_to_center"] == 0.01
+    assert second[1]["distance_to_center"] == pytest.approx(math.dist([1.2, 1.2], [1.0, 1.0]), abs=1e-6)
+    assert [r["type"] for r in second] == ["STEADY", "DISCOVERY"]
+
+
+def test_recommend_candidates_reports_nearest_golden(mock_dataset_deps):
+    """[Case 6] With several goldens, each candidate also gets its distance to the closest one"""
+    manager = VectorWaveDatasetManager()
+
+    mock_dataset_deps["golden_col"].query.fetch_objects.return_value.objects = [
+        create_mock_obj("gold-1", {"original_uuid": "origin-1"}, [1.0, 1.0]),
+        create_mock_obj("gold-2", {"original_uuid": "origin-2"}, [1.2, 1.2]),
+    ]
+    mock_dataset_deps["exec_col"].query.near_vector.return_value.objects = [
+        create_mock_obj("cand-a", {"return_value": "A"}, [1.15, 1.15]),
+        create_mock_obj("cand-b", {"return_value": "B"}, [0.95, 1.0]),
+    ]
+
+    recommendations = {r["uuid"]: r for r in manager.recommend_candidates("test_func")}
+
+    assert recommendations["cand-a"]["distance_to_nearest_golden"] == pytest.approx(
+        math.dist([1.15, 1.15], [1.2, 1.2]), abs=1e-5)
+    assert recommendations["cand-b"]["distance_to_nearest_golden"] == pytest.approx(
+        math.dist([0.95, 1.0], [1.0, 1.0]), abs=1e-5)
+    assert recommendations["cand-a"]["distance_to_center"] == pytest.approx(
+        math.dist([1.15, 1.15], [1.1, 1.1]), abs=1e-5)
+
+
+def test_recommend_candidates_nearest_golden_is_exact_for_identical_vectors(mock_dataset_deps, monkeypatch):
+    """Candidates identical to golden 384-d unit embeddings are at distance ~0, not float32 noise"""
+    import numpy as np
+
+    manager = VectorWaveDatasetManager()
+    rng = np.random.default_rng(0)
+    goldens = rng.normal(size=(8, 384)).astype(np.float32)
+    goldens /= np.linalg.norm(goldens, axis=1, keepdims=True)
+
+    mock_dataset_deps["golden_col"].query.fetch_objects.return_value.objects = [
+        create_mock_obj(f"gold-{i}", {"original_uuid": f"origin-{i}"}, g.tolist()) for i, g in enumerate(goldens)
+    ]
+    mock_dataset_deps["exec_col"].query.near_vector.return_value.objects = [
+        create_mock_obj(f"cand-{i}", {"return_value": str(i)}, g.tolist()) for i, g in enumerate(goldens)
+    ]
+    # Wide margin so the candidate is recommended regardless of where it sits relative to the centroid
+    monkeypatch.setattr(mock_dataset_deps["settings"], "RECOMMENDATION_STEADY_MARGIN", 2.0)
+
+    recommendations = manager.recommend_candidates("test_func", limit=len(goldens))
+
+    assert len(recommendations) == len(goldens)
+    assert max(r["distance_to_nearest_golden"] for r in recommendations) < 1e-6
+
+
+def test_recommend_candidates_distance_cache_keeps_only_current_candidates(mock_dataset_deps):
+    """The per-function distance cache is bounded by the latest candidate set"""
+    manager = VectorWaveDatasetManager()
+
+    mock_dataset_deps["golden_col"].query.fetch_objects.return_value.objects = [
+        create_mock_obj("gold-1", {"original_uuid": "origin-1"}, [1.0, 1.0])
+    ]
+    near_vector = mock_dataset_deps["exec_col"].query.near_vector
+
+    near_vector.return_value.objects = [create_mock_obj("cand-a", {"return_value": "A"}, [1.05, 1.05])]
+    manager.recommend_candidates("test_func")
+    near_vector.return_value.objects = [create_mock_obj("cand-b", {"return_value": "B"}, [1.2, 1.2])]
+    manager.recommend_candidates("test_func")
+
+    assert set(manager._distance_cache["test_func"]) == {"cand-b"}
@@ -60,6 +60,13 @@ def test_get_weaviate_client_success(mock_connect_to_local, test_settings):
     mock_client.is_ready.assert_called_once()
     assert client == mock_client
 
+    timeout = mock_connect_to_local.call_args.kwargs["additional_config"].timeout
+    assert (timeout.init, timeout.query, timeout.insert) == (
+        test_settings.WEAVIATE_TIMEOUT_INIT,
+        test_settings.WEAVIATE_TIMEOUT_QUERY,
+        test_settings.WEAVIATE_TIMEOUT_INSERT
+    )
+
 
 @patch('vectorwave.database.db.weaviate.connect_to_local')
 def test_get_weaviate_client_connection_refused(mock_connect_to_local, test_settings):
@@ -358,9 +365,28 @@ def test_create_execution_schema_new(mock_vectorizer_none, test_settings):
     assert "return_value" in passed_props_map
     assert passed_props_map["return_value"].dataType == wvc.DataType.TEXT
 
+    # SQ quantization is enabled by default
+    index_config = call_args.kwargs.get('vector_index_config')
+    assert index_config.quantizer.rescoreLimit == test_settings.EXECUTION_SQ_RESCORE_LIMIT
+
     assert collection == mock_new_collection
 
 
+def test_create_execution_schema_without_quantization(test_settings):
+    """
+    Case 10-1: EXECUTION_VECTOR_QUANTIZATION=False leaves the default (unquantized) vector index
+    """
+    test_settings.EXECUTION_VECTOR_QUANTIZATION = False
+    mock_client = MagicMock(spec=weaviate.WeaviateClient)
+    mock_collections = MagicMock()
+    mock_collections.exists.return_value = False
+    mock_client.collections = mock_collections
+
+    create_execution_schema(mock_client, test_settings)
+
+    assert mock_collections.create.call_args.kwargs.get('vector_index_config') is None
+
+
 def test_create_execution_schema_existing(test_settings):
     """
     Case 11: Test if creation is skipped when 'VectorWaveExecutions' schema already exists
@@ -468,4 +494,32 @@ def test_create_schema_vectorizer_invalid(test_settings):
         create_vectorwave_schema(mock_client, test_settings)
 
     assert "Invalid VECTORIZER setting" in str(exc_info.value)
-    assert "unsupported-module" in str(exc_info.value)
\ No newline at end of file
+    assert "unsupported-module" in str(exc_info.value)
+
+
+# --- Tests for wait_for_indexed ---
+
+def test_wait_for_indexed_returns_once_count_reached(monkeypatch):
+    """
+    Polls the aggregate count until the expected number of objects is seen
+    """
+    from vectorwave.database.db import wait_for_indexed
+
+    mock_client = MagicMock()
+    mock_aggregate = mock_client.collections.get.return_value.aggregate.over_all
+    mock_aggregate.side_effect = [MagicMock(total_count=c) for c in (0, 3, 5)]
+    monkeypatch.setattr("vectorwave.database.db.get_cached_client", lambda: mock_client)
+
+    assert wait_for_indexed("TestExecutions", 5, timeout=5, poll=0) is True
+    assert mock_aggregate.call_count == 3
+    mock_client.collections.get.assert_called_with("TestExecutions")
+
+
+def test_wait_for_indexed_times_out(monkeypatch):
+    from vectorwave.database.db import wait_for_indexed
+
+    mock_client = MagicMock()
+    mock_client.collections.get.return_value.aggregate.over_all.return_value = MagicMock(total_count=1)
+    monkeypatch.setattr("vectorwave.database.db.get_cached_client", lambda: mock_client)
+
+    assert wait_for_indexed("TestExecutions", 5, timeout=0, poll=0) is False
@@ -0,0 +1,124 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from vectorwave.database.db_search import check_semantic_drift
+from vectorwave.models.db_config import WeaviateSettings
+from vectorwave.monitoring import drift
+
+
+@pytest.fixture
+def mock_drift_deps(monkeypatch, tmp_path):
+    """Isolates the baseline file/state and mocks the execution collection"""
+    monkeypatch.setattr(drift, "_baselines", None)
+    monkeypatch.setattr(drift, "_baselines_mtime", None)
+
+    settings = WeaviateSettings(
+        EXECUTION_COLLECTION_NAME="TestExecutions",
+        DRIFT_USE_BASELINE=True,
+        DRIFT_Z_THRESHOLD=3.0,
+        DRIFT_BASELINE_MIN_SAMPLES=2,
+        DRIFT_BASELINE_FILE_PATH=str(tmp_path / "baseline.json")
+    )
+    mock_client = MagicMock()
+    mock_collection = mock_client.collections.get.return_value
+
+    monkeypatch.setattr("vectorwave.monitoring.drift.get_weaviate_settings", lambda: settings)
+    monkeypatch.setattr("vectorwave.monitoring.drift.get_cached_client", lambda: mock_client)
+    monkeypatch.setattr("vectorwave.database.db_search.get_weaviate_settings", lambda: settings)
+    monkeypatch.setattr("vectorwave.database.db_search.get_cached_client", lambda: mock_client)
+
+    return {"collection": mock_collection, "settings": settings, "path": tmp_path / "baseline.json"}
+
+
+def _log(vector):
+    obj = MagicMock()
+    obj.vector = {"default": vector}
+    return obj
+
+
+def test_finalize_baseline_computes_and_persists_stats(mock_drift_deps):
+    mock_drift_deps["collection"].query.fetch_objects.return_value.objects = [
+        _log([1.0, 0.0]), _log([0.0, 1.0]), _log([0.0, 0.0])
+    ]
+
+    baseline = drift.finalize_baseline("product_inquiry")
+
+    # Both vectors sit at 45 degrees from the centroid; the zero vector is skipped
+    expected = 1 - 2 ** -0.5
+    assert baseline["mu"] == pytest.approx(expected, abs=1e-6)
+    assert baseline["sigma"] == pytest.approx(drift._MIN_SIGMA)
+    assert baseline["count"] == 2
+
+    saved = json.loads(mock_drift_deps["path"].read_text())
+    assert saved["product_inquiry"]["mu"] == pytest.approx(expected, abs=1e-6)
+    assert saved["product_inquiry"]["version"] == drift.BASELINE_VERSION
+
+
+def test_finalize_baseline_requires_min_samples(mock_drift_deps):
+    mock_drift_deps["collection"].query.fetch_objects.return_value.objects = [_log([1.0, 0.0])]
+
+    assert drift.finalize_baseline("product_inquiry") is None
+    assert drift.get_baseline("product_inquiry") is None
+
+
+def test_baseline_from_another_model_is_ignored(mock_drift_deps):
+    mock_drift_deps["collection"].query.fetch_objects.return_value.objects = [
+        _log([1.0, 0.0]), _log([0.0, 1.0])
+    ]
+    drift.finalize_baseline("product_inquiry")
+
+    saved = json.loads(mock_drift_deps["path"].read_text())
+    saved["product_inquiry"]["embedding"] = "huggingface:some-other-model"
+    mock_drift_deps["path"].write_text(json.dumps(saved))
+    drift._baselines = None
+
+    assert drift.get_baseline("product_inquiry") is None
+
+
+def test_clear_baseline_falls_back_to_knn(mock_drift_deps):
+    collection = mock_drift_deps["collection"]
+    collection.query.fetch_objects.return_value.objects = [_log([1.0, 0.0]), _log([0.9, 0.1])]
+    drift.finalize_baseline("product_inquiry")
+
+    assert drift.clear_baseline("product_inquiry") is True
+    collection.query.near_vector.return_value.objects = []
+    check_semantic_drift([1.0, 0.0], "product_inquiry", threshold=0.25)
+
+    collection.query.near_vector.assert_called_once()
+
+
+def test_score_against_baseline_handles_zero_vector():
+    baseline = {"centroid": drift.np.asarray([1.0, 0.0], dtype=drift.np.float32), "mu": 0.1, "sigma": 0.05}
+    assert drift.score_against_baseline([0.0, 0.0], baseline) == (0.0, 0.0)
+
+
+def test_check_semantic_drift_uses_baseline_without_knn_query(mock_drift_deps):
+    collection = mock_drift_deps["collection"]
+    collection.query.fetch_objects.return_value.objects = [
+        _log([1.0, 0.0]), _log([0.99, 0.14]), _log([0.99, -0.14])
+    ]
+    drift.finalize_baseline("product_inquiry")
+
+    is_drift, _, nearest = check_semantic_drift([1.0, 0.0], "product_inquiry", threshold=0.25)
+    assert is_drift is False
+    assert nearest is None
+
+    is_drift, dist, _ = check_semantic_drift([0.0, 1.0], "product_inquiry", threshold=0.25)
+    assert is_drift is True
+    assert dist == pytest.approx(1.0, abs=1e-3)
+
+    collection.query.near_vector.assert_not_called()
+
+
+def test_check_semantic_drift_ignores_baseline_unless_enabled(mock_drift_deps, monkeypatch):
+    collection = mock_drift_deps["collection"]
+    collection.query.fetch_objects.return_value.objects = [_log([1.0, 0.0]), _log([0.9, 0.1])]
+    drift.finalize_baseline("product_inquiry")
+
+    monkeypatch.setattr(mock_drift_deps["settings"], "DRIFT_USE_BASELINE", False)
+    collection.query.near_vector.return_value.objects = []
+    check_semantic_drift([0.0, 1.0], "product_inquiry", threshold=0.25)
+
+    collection.query.near_vector.assert_called_once()
@@ -4,7 +4,7 @@ import json
 from datetime import datetime
 import time
 
-from vectorwave.monitoring.tracer import trace_root, trace_span, _mask_and_serialize
+from vectorwave.monitoring.tracer import trace_root, trace_span, _mask_and_serialize, _deserialize_return_value
 
 from vectorwave.models.db_config import WeaviateSettings
 
@@ -351,3 +351,31 @@ def test_trace_span_error_code_priority_3_default_class_name(mock_tracer_deps):
     assert kwargs["properties"]["status"] == "ERROR"
     assert kwargs["properties"]["error_code"] == "KeyError"
     assert kwargs["properties"]["parent_span_id"] == "mock-parent-id-456"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("stored, expected", [
+    ('{"a": [1, 2]}', {"a": [1, 2]}),
+    (b'{"a": [1, 2]}', {"a": [1, 2]}),
+    ('"quoted"', "quoted"),
+    ("Plain String", "Plain String"),
+    (None, None),
+])
+def test_deserialize_return_value(monkeypatch, use_orjson, stored, expected):
+    """
+    Stored return values decode identically with or without the optional orjson backend.
+    """
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(f"{TRACER_MODULE_PATH}.orjson", None)
+
+    assert _deserialize_return_value(stored) == expected
+
+
+def test_deserialize_return_value_falls_back_for_nan():
+    """
+    json.dumps can emit NaN, which orjson rejects; the stdlib fallback must still decode it.
+    """
+    result = _deserialize_return_value(json.dumps({"x": float("nan")}))
+    assert result["x"] != result["x"]
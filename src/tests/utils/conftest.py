@@ -0,0 +1,199 @@
+import inspect
+from functools import lru_cache
+from unittest.mock import MagicMock
+
+import pytest
+
+from vectorwave.models.db_config import WeaviateSettings
+
+
+# --- Shared Fixtures for vectorwave.utils tests ---
+
+@pytest.fixture(scope="session")
+def signature_factory():
+    """
+    Returns a memoized builder of `inspect.Signature` objects keyed by a tuple of parameter names.
+    Signatures are immutable, so a single instance can be shared by every test in the session.
+    """
+    @lru_cache(maxsize=None)
+    def _build(param_names):
+        return inspect.Signature([
+            inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+            for name in param_names
+        ])
+
+    return _build
+
+
+@pytest.fixture
+def mock_replayer_deps(monkeypatch):
+    """
+    Mocks the DB client and settings used by the Replayer (Default Setup).
+    """
+    # Settings Mock
+    mock_settings = MagicMock()
+    mock_settings.EXECUTION_COLLECTION_NAME = "VectorWaveExecutions"
+    mock_settings.GOLDEN_COLLECTION_NAME = "VectorWaveGoldenDataset"
+
+    # Weaviate Client & Collection Mock
+    mock_client = MagicMock()
+    mock_collection = MagicMock()
+    mock_client.collections.get.return_value = mock_collection
+
+    # Query Response Mock (Default: empty list)
+    mock_query = MagicMock()
+    mock_query.fetch_objects.return_value = MagicMock(objects=[])
+    mock_collection.query = mock_query
+
+    # Data Operation Mock
+    mock_data = MagicMock()
+    mock_collection.data = mock_data
+
+    # Dynamic Import Mock (tests set return_value to their mock module)
+    mock_import = MagicMock()
+
+    # Apply Patches
+    monkeypatch.setattr("vectorwave.utils.replayer.get_cached_client", MagicMock(return_value=mock_client))
+    monkeypatch.setattr("vectorwave.utils.replayer.get_weaviate_settings", MagicMock(return_value=mock_settings))
+    monkeypatch.setattr("vectorwave.utils.replayer.importlib.import_module", mock_import)
+
+    return {
+        "collection": mock_collection,
+        "query": mock_query,
+        "data": mock_data,
+        "import_module": mock_import
+    }
+
+@pytest.fixture
+def mock_replayer_deps_v2(monkeypatch):
+    """
+    Mock fixture separating Golden and Execution collections for Priority Testing.
+    """
+    # Settings
+    mock_settings = WeaviateSettings(
+        EXECUTION_COLLECTION_NAME="Executions",
+        GOLDEN_COLLECTION_NAME="GoldenData"
+    )
+    mock_get_settings = MagicMock(return_value=mock_settings)
+
+    # Client & Collections
+    mock_client = MagicMock()
+    mock_exec_col = MagicMock()
+    mock_golden_col = MagicMock()
+
+    def get_collection_side_effect(name):
+        if name == "Executions": return mock_exec_col
+        if name == "GoldenData": return mock_golden_col
+        return MagicMock()
+
+    mock_client.collections.get.side_effect = get_collection_side_effect
+    mock_get_client = MagicMock(return_value=mock_client)
+    mock_import = MagicMock()
+
+    monkeypatch.setattr("vectorwave.utils.replayer.get_cached_client", mock_get_client)
+    monkeypatch.setattr("vectorwave.utils.replayer.get_weaviate_settings", mock_get_settings)
+    monkeypatch.setattr("vectorwave.utils.replayer.importlib.import_module", mock_import)
+
+    return {
+        "golden_col": mock_golden_col,
+        "exec_col": mock_exec_col,
+        "import_module": mock_import
+    }
+
+
+@pytest.fixture
+def mock_caching_utils_deps(monkeypatch):
+    """
+    Mocks external dependencies of return_caching_utils.py (BatchManager, Tracer, DB search, etc.).
+    """
+    # 1. Mock Settings
+    mock_settings = WeaviateSettings(
+        EXECUTION_COLLECTION_NAME="TestExecutions",
+        global_custom_values={"run_id": "test-run-123"}
+    )
+    mock_get_settings = MagicMock(return_value=mock_settings)
+
+    # 2. Mock Batch Manager (Key verification target)
+    mock_batch_manager = MagicMock()
+    mock_batch_manager.add_object = MagicMock()
+    mock_get_batch = MagicMock(return_value=mock_batch_manager)
+
+    # 3. Mock Vectorizer
+    mock_vectorizer = MagicMock()
+    mock_vectorizer.embed.return_value = [0.1, 0.2, 0.3]  # Dummy Vector
+    mock_get_vectorizer = MagicMock(return_value=mock_vectorizer)
+
+    # 4. Mock Tracer Context (Provides current Trace ID)
+    mock_tracer = MagicMock()
+    mock_tracer.trace_id = "existing-trace-id-abc"
+
+    # 5. Apply Monkeypatches
+    TARGET_MODULE = "vectorwave.utils.return_caching_utils"
+
+    monkeypatch.setattr(f"{TARGET_MODULE}.get_weaviate_settings", mock_get_settings)
+    monkeypatch.setattr(f"{TARGET_MODULE}.get_batch_manager", mock_get_batch)
+    monkeypatch.setattr(f"{TARGET_MODULE}.get_vectorizer", mock_get_vectorizer)
+
+    return {
+        "batch_manager": mock_batch_manager,
+        "vectorizer": mock_vectorizer,
+        "tracer_obj": mock_tracer
+    }
+
+
+@pytest.fixture
+def mock_caching_utils_deps_v2(monkeypatch):
+    """
+    Enhanced Mock Fixture for Golden Dataset testing.
+    Mocks Client, Golden Collection, and Standard Search.
+    """
+    # Settings Mock
+    mock_settings = WeaviateSettings(
+        EXECUTION_COLLECTION_NAME="Executions",
+        GOLDEN_COLLECTION_NAME="GoldenData"
+    )
+    mock_get_settings = MagicMock(return_value=mock_settings)
+
+    # Client & Golden Collection Mock
+    mock_client = MagicMock()
+    mock_golden_col = MagicMock()
+    mock_exec_col = MagicMock()
+    # No SimHash prefilter match by default
+    mock_golden_col.query.fetch_objects.return_value.objects = []
+    mock_exec_col.query.fetch_objects.return_value.objects = []
+
+    def get_collection_side_effect(name):
+        if name == "GoldenData": return mock_golden_col
+        return mock_exec_col
+
+    mock_client.collections.get.side_effect = get_collection_side_effect
+    mock_get_client = MagicMock(return_value=mock_client)
+
+    # Vectorizer Mock
+    mock_vectorizer = MagicMock()
+    mock_vectorizer.embed.return_value = [0.1, 0.2]
+    mock_get_vectorizer = MagicMock(return_value=mock_vectorizer)
+
+    # Batch Mock
+    mock_batch = MagicMock()
+    mock_get_batch = MagicMock(return_value=mock_batch)
+
+    # Patching
+    TARGET = "vectorwave.utils.return_caching_utils"
+    monkeypatch.setattr(f"{TARGET}.get_weaviate_settings", mock_get_settings)
+    monkeypatch.setattr(f"{TARGET}.get_cached_client", mock_get_client)
+    monkeypatch.setattr(f"{TARGET}.get_vectorizer", mock_get_vectorizer)
+    monkeypatch.setattr(f"{TARGET}.get_batch_manager", mock_get_batch)
+
+    # Important: Mock search_similar_execution (Standard Search)
+    mock_search_std = MagicMock(return_value=None)
+    monkeypatch.setattr(f"{TARGET}.search_similar_execution", mock_search_std)
+
+    return {
+        "golden_col": mock_golden_col,
+        "exec_col": mock_exec_col,
+        "search_std": mock_search_std,
+        "batch": mock_batch,
+        "vectorizer": mock_vectorizer,
+        "settings": mock_settings
+    }
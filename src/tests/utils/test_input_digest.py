@@ -0,0 +1,20 @@
+from vectorwave.utils.input_digest import input_digest64
+
+
+def test_input_digest64_is_deterministic_and_signed_int64():
+    text = "Function Context: heavy_cached_query user_query: payment of 100 dollars"
+    value = input_digest64(text)
+
+    assert value == input_digest64(text)
+    assert -(1 << 63) <= value < (1 << 63)
+
+
+def test_input_digest64_differs_for_near_identical_inputs():
+    base = "Function Context: heavy_cached_query user_query: payment of 100 dollars"
+    assert input_digest64(base) != input_digest64(base.replace("100", "101"))
+    assert input_digest64(base) != input_digest64(base + " ")
+
+
+def test_input_digest64_handles_short_text():
+    assert isinstance(input_digest64(""), int)
+    assert input_digest64("ab") == input_digest64("ab")
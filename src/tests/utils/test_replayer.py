@@ -1,79 +1,11 @@
-import pytest
 import json
 import asyncio
 import inspect
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from vectorwave.utils.replayer import VectorWaveReplayer
-from vectorwave.models.db_config import WeaviateSettings
 
-# --- 1. Mock Fixtures (Mock Environment Setup) ---
-
-@pytest.fixture
-def mock_replayer_deps(monkeypatch):
-    """
-    Mocks the DB client and settings used by the Replayer (Default Setup).
-    """
-    # Settings Mock
-    mock_settings = MagicMock()
-    mock_settings.EXECUTION_COLLECTION_NAME = "VectorWaveExecutions"
-    mock_settings.GOLDEN_COLLECTION_NAME = "VectorWaveGoldenDataset"
-
-    # Weaviate Client & Collection Mock
-    mock_client = MagicMock()
-    mock_collection = MagicMock()
-    mock_client.collections.get.return_value = mock_collection
-
-    # Query Response Mock (Default: empty list)
-    mock_query = MagicMock()
-    mock_query.fetch_objects.return_value = MagicMock(objects=[])
-    mock_collection.query = mock_query
-
-    # Data Operation Mock
-    mock_data = MagicMock()
-    mock_collection.data = mock_data
-
-    # Apply Patches
-    monkeypatch.setattr("vectorwave.utils.replayer.get_cached_client", MagicMock(return_value=mock_client))
-    monkeypatch.setattr("vectorwave.utils.replayer.get_weaviate_settings", MagicMock(return_value=mock_settings))
-
-    return {
-        "collection": mock_collection,
-        "query": mock_query,
-        "data": mock_data
-    }
-
-@pytest.fixture
-def mock_replayer_deps_v2(monkeypatch):
-    """
-    Mock fixture separating Golden and Execution collections for Priority Testing.
-    """
-    # Settings
-    mock_settings = WeaviateSettings(
-        EXECUTION_COLLECTION_NAME="Executions",
-        GOLDEN_COLLECTION_NAME="GoldenData"
-    )
-    mock_get_settings = MagicMock(return_value=mock_settings)
-
-    # Client & Collections
-    mock_client = MagicMock()
-    mock_exec_col = MagicMock()
-    mock_golden_col = MagicMock()
-
-    def get_collection_side_effect(name):
-        if name == "Executions": return mock_exec_col
-        if name == "GoldenData": return mock_golden_col
-        return MagicMock()
-
-    mock_client.collections.get.side_effect = get_collection_side_effect
-    mock_get_client = MagicMock(return_value=mock_client)
-
-    monkeypatch.setattr("vectorwave.utils.replayer.get_cached_client", mock_get_client)
-    monkeypatch.setattr("vectorwave.utils.replayer.get_weaviate_settings", mock_get_settings)
-
-    return {
-        "golden_col": mock_golden_col,
-        "exec_col": mock_exec_col
-    }
+# --- 1. Helpers (Fixtures live in conftest.py) ---
 
 def create_mock_log(uuid_str, inputs, return_value):
     """Mimics a log object retrieved from the database."""
@@ -85,70 +17,61 @@ def create_mock_log(uuid_str, inputs, return_value):
     mock_obj.properties = props
     return mock_obj
 
+def create_stub_func(value, signature):
+    """Lightweight stand-in for MagicMock(return_value=...) when call arguments aren't asserted."""
+    def _func(**kwargs):
+        return value
+    _func.__signature__ = signature
+    return _func
+
 # --- 2. Test Cases ---
 
-def test_replay_success_match(mock_replayer_deps):
+def test_replay_success_match(mock_replayer_deps, signature_factory):
     """[Case 1] Successful Pass"""
     replayer = VectorWaveReplayer()
     mock_logs = [create_mock_log("uuid-1", {"a": 1, "b": 2}, 3)]
     mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
 
     mock_func = MagicMock(return_value=3)
-    mock_func.__signature__ = inspect.Signature([
-        inspect.Parameter('a', inspect.Parameter.POSITIONAL_OR_KEYWORD),
-        inspect.Parameter('b', inspect.Parameter.POSITIONAL_OR_KEYWORD)
-    ])
+    mock_func.__signature__ = signature_factory(("a", "b"))
 
-    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
-        mock_module = MagicMock()
-        setattr(mock_module, "add", mock_func)
-        mock_import.return_value = mock_module
+    mock_module = SimpleNamespace(add=mock_func)
+    mock_replayer_deps["import_module"].return_value = mock_module
 
-        result = replayer.replay("my_module.add", limit=1)
+    result = replayer.replay("my_module.add", limit=1)
 
     assert result["passed"] == 1
     assert result["failed"] == 0
     mock_func.assert_called_with(a=1, b=2)
 
-def test_replay_failure_mismatch(mock_replayer_deps):
+def test_replay_failure_mismatch(mock_replayer_deps, signature_factory):
     """[Case 2] Failure: Regression check"""
     replayer = VectorWaveReplayer()
     mock_logs = [create_mock_log("uuid-2", {"a": 1, "b": 2}, 3)]
     mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
 
-    mock_func = MagicMock(return_value=99) # Bug
-    mock_func.__signature__ = inspect.Signature([
-        inspect.Parameter('a', inspect.Parameter.POSITIONAL_OR_KEYWORD),
-        inspect.Parameter('b', inspect.Parameter.POSITIONAL_OR_KEYWORD)
-    ])
+    mock_func = create_stub_func(99, signature_factory(("a", "b")))  # Bug
 
-    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
-        mock_module = MagicMock()
-        setattr(mock_module, "add", mock_func)
-        mock_import.return_value = mock_module
-        result = replayer.replay("my_module.add")
+    mock_module = SimpleNamespace(add=mock_func)
+    mock_replayer_deps["import_module"].return_value = mock_module
+    result = replayer.replay("my_module.add")
 
     assert result["passed"] == 0
     assert result["failed"] == 1
     assert result["failures"][0]["expected"] == 3
     assert result["failures"][0]["actual"] == 99
 
-def test_replay_update_baseline(mock_replayer_deps):
+def test_replay_update_baseline(mock_replayer_deps, signature_factory):
     """[Case 3] Update Baseline"""
     replayer = VectorWaveReplayer()
     mock_logs = [create_mock_log("uuid-3", {"msg": "Hi"}, "Old")]
     mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
 
-    mock_func = MagicMock(return_value="New")
-    mock_func.__signature__ = inspect.Signature([
-        inspect.Parameter('msg', inspect.Parameter.POSITIONAL_OR_KEYWORD)
-    ])
+    mock_func = create_stub_func("New", signature_factory(("msg",)))
 
-    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
-        mock_module = MagicMock()
-        setattr(mock_module, "greet", mock_func)
-        mock_import.return_value = mock_module
-        result = replayer.replay("my_module.greet", update_baseline=True)
+    mock_module = SimpleNamespace(greet=mock_func)
+    mock_replayer_deps["import_module"].return_value = mock_module
+    result = replayer.replay("my_module.greet", update_baseline=True)
 
     assert result["updated"] == 1
     mock_replayer_deps["data"].update.assert_called_once_with(
@@ -156,7 +79,7 @@ def test_replay_update_baseline(mock_replayer_deps):
         properties={"return_value": '"New"'}
     )
 
-def test_replay_argument_filtering(mock_replayer_deps):
+def test_replay_argument_filtering(mock_replayer_deps, signature_factory):
     """[Case 4] Argument Filtering"""
     replayer = VectorWaveReplayer()
     inputs = {"a": 10, "team": "billing", "priority": 1}
@@ -164,19 +87,15 @@ def test_replay_argument_filtering(mock_replayer_deps):
     mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
 
     mock_func = MagicMock(return_value=100)
-    mock_func.__signature__ = inspect.Signature([
-        inspect.Parameter('a', inspect.Parameter.POSITIONAL_OR_KEYWORD)
-    ])
+    mock_func.__signature__ = signature_factory(("a",))
 
-    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
-        mock_module = MagicMock()
-        setattr(mock_module, "calc", mock_func)
-        mock_import.return_value = mock_module
-        replayer.replay("my_module.calc")
+    mock_module = SimpleNamespace(calc=mock_func)
+    mock_replayer_deps["import_module"].return_value = mock_module
+    replayer.replay("my_module.calc")
 
     mock_func.assert_called_once_with(a=10)
 
-def test_replay_async_function_execution_fixed(mock_replayer_deps):
+def test_replay_async_function_execution_fixed(mock_replayer_deps, signature_factory):
     """[Case 5] Async Function Test"""
     replayer = VectorWaveReplayer()
     inputs = {"a": 1, "b": 2}
@@ -188,26 +107,20 @@ def test_replay_async_function_execution_fixed(mock_replayer_deps):
         await asyncio.sleep(0.001)
         return a + b
 
-    setattr(real_async_add, '__signature__', inspect.Signature([
-        inspect.Parameter('a', inspect.Parameter.POSITIONAL_OR_KEYWORD),
-        inspect.Parameter('b', inspect.Parameter.POSITIONAL_OR_KEYWORD)
-    ]))
+    setattr(real_async_add, '__signature__', signature_factory(("a", "b")))
 
-    mock_module = MagicMock()
-    mock_module.async_add = real_async_add
+    mock_module = SimpleNamespace(async_add=real_async_add)
 
-    with patch("vectorwave.utils.replayer.importlib.import_module", return_value=mock_module):
-        result = replayer.replay("my_module.async_add", limit=1)
+    mock_replayer_deps["import_module"].return_value = mock_module
+    result = replayer.replay("my_module.async_add", limit=1)
 
     assert result["passed"] == 1
     assert result["failed"] == 0
 
-def test_replay_fetches_golden_first(mock_replayer_deps_v2):
+def test_replay_fetches_golden_first(mock_replayer_deps_v2, signature_factory):
     """
     [Case 6] Test if Replayer prioritizes fetching Golden Data
     """
-    from vectorwave.utils.replayer import VectorWaveReplayer
-
     # Arrange
     # 1. Setup one Golden Data entry
     golden_obj = MagicMock()
@@ -224,24 +137,36 @@ def test_replay_fetches_golden_first(mock_replayer_deps_v2):
     mock_replayer_deps_v2["exec_col"].query.fetch_objects.return_value.objects = []
 
     # Function Mock
-    mock_func = MagicMock(return_value=3)
-    mock_func.__signature__ = inspect.Signature([
-        inspect.Parameter('a', inspect.Parameter.POSITIONAL_OR_KEYWORD),
-        inspect.Parameter('b', inspect.Parameter.POSITIONAL_OR_KEYWORD)
-    ])
+    mock_func = create_stub_func(3, signature_factory(("a", "b")))
 
     # Act
     replayer = VectorWaveReplayer()
-    with patch("vectorwave.utils.replayer.importlib.import_module") as mock_import:
-        mock_module = MagicMock()
-        setattr(mock_module, "add", mock_func)
-        mock_import.return_value = mock_module
+    mock_module = SimpleNamespace(add=mock_func)
+    mock_replayer_deps_v2["import_module"].return_value = mock_module
 
-        result = replayer.replay("mod.add", limit=10)
+    result = replayer.replay("mod.add", limit=10)
 
     # Assert
     assert result["total"] == 1
     # Verify that the Golden Collection was queried
     mock_replayer_deps_v2["golden_col"].query.fetch_objects.assert_called_once()
     # Verify that fetch_object_by_id was called to retrieve the original log
-    mock_replayer_deps_v2["exec_col"].query.fetch_object_by_id.assert_called_with("orig-1")
\ No newline at end of file
+    mock_replayer_deps_v2["exec_col"].query.fetch_object_by_id.assert_called_with("orig-1")
+
+def test_replay_inspects_signature_once(mock_replayer_deps, monkeypatch):
+    """[Case 7] The target signature is resolved once per run, not once per log."""
+    replayer = VectorWaveReplayer()
+    mock_logs = [create_mock_log(f"uuid-{i}", {"a": i, "extra": "x"}, i) for i in range(3)]
+    mock_replayer_deps["query"].fetch_objects.return_value.objects = mock_logs
+
+    def ident(a):
+        return a
+    mock_replayer_deps["import_module"].return_value = SimpleNamespace(ident=ident)
+
+    signature_spy = MagicMock(wraps=inspect.signature)
+    monkeypatch.setattr(inspect, "signature", signature_spy)
+
+    result = replayer.replay("my_module.ident", limit=3)
+
+    assert result["passed"] == 3
+    signature_spy.assert_called_once_with(ident)
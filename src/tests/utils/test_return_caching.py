@@ -3,105 +3,31 @@ from unittest.mock import MagicMock, patch
 import json
 import weaviate.classes.query as wvc_query
 from vectorwave.utils.return_caching_utils import _check_and_return_cached_result
-from vectorwave.models.db_config import WeaviateSettings
+from vectorwave.monitoring.tracer import current_tracer_var, current_span_id_var
 
 
-# --- Mock Fixtures ---
+# --- Mock Fixtures (shared deps live in conftest.py) ---
 
 @pytest.fixture
-def mock_caching_utils_deps(monkeypatch):
+def active_trace_context():
     """
-    Mocks external dependencies of return_caching_utils.py (BatchManager, Tracer, DB search, etc.).
+    Sets the tracer/span ContextVars directly and resets them via their tokens after the test.
     """
-    # 1. Mock Settings
-    mock_settings = WeaviateSettings(
-        EXECUTION_COLLECTION_NAME="TestExecutions",
-        global_custom_values={"run_id": "test-run-123"}
-    )
-    mock_get_settings = MagicMock(return_value=mock_settings)
-
-    # 2. Mock Batch Manager (Key verification target)
-    mock_batch_manager = MagicMock()
-    mock_batch_manager.add_object = MagicMock()
-    mock_get_batch = MagicMock(return_value=mock_batch_manager)
-
-    # 3. Mock Vectorizer
-    mock_vectorizer = MagicMock()
-    mock_vectorizer.embed.return_value = [0.1, 0.2, 0.3]  # Dummy Vector
-    mock_get_vectorizer = MagicMock(return_value=mock_vectorizer)
-
-    # 4. Mock Tracer Context (Provides current Trace ID)
-    mock_tracer = MagicMock()
-    mock_tracer.trace_id = "existing-trace-id-abc"
+    tokens = []
 
-    # 5. Apply Monkeypatches
-    TARGET_MODULE = "vectorwave.utils.return_caching_utils"
-
-    monkeypatch.setattr(f"{TARGET_MODULE}.get_weaviate_settings", mock_get_settings)
-    monkeypatch.setattr(f"{TARGET_MODULE}.get_batch_manager", mock_get_batch)
-    monkeypatch.setattr(f"{TARGET_MODULE}.get_vectorizer", mock_get_vectorizer)
-
-    return {
-        "batch_manager": mock_batch_manager,
-        "vectorizer": mock_vectorizer,
-        "tracer_obj": mock_tracer
-    }
+    def _activate(tracer, parent_span_id):
+        tokens.append((current_tracer_var, current_tracer_var.set(tracer)))
+        tokens.append((current_span_id_var, current_span_id_var.set(parent_span_id)))
 
+    yield _activate
 
-@pytest.fixture
-def mock_caching_utils_deps_v2(monkeypatch):
-    """
-    Enhanced Mock Fixture for Golden Dataset testing.
-    Mocks Client, Golden Collection, and Standard Search.
-    """
-    # Settings Mock
-    mock_settings = WeaviateSettings(
-        EXECUTION_COLLECTION_NAME="Executions",
-        GOLDEN_COLLECTION_NAME="GoldenData"
-    )
-    mock_get_settings = MagicMock(return_value=mock_settings)
-
-    # Client & Golden Collection Mock
-    mock_client = MagicMock()
-    mock_golden_col = MagicMock()
-
-    def get_collection_side_effect(name):
-        if name == "GoldenData": return mock_golden_col
-        return MagicMock()
-
-    mock_client.collections.get.side_effect = get_collection_side_effect
-    mock_get_client = MagicMock(return_value=mock_client)
-
-    # Vectorizer Mock
-    mock_vectorizer = MagicMock()
-    mock_vectorizer.embed.return_value = [0.1, 0.2]
-    mock_get_vectorizer = MagicMock(return_value=mock_vectorizer)
-
-    # Batch Mock
-    mock_batch = MagicMock()
-    mock_get_batch = MagicMock(return_value=mock_batch)
-
-    # Patching
-    TARGET = "vectorwave.utils.return_caching_utils"
-    monkeypatch.setattr(f"{TARGET}.get_weaviate_settings", mock_get_settings)
-    monkeypatch.setattr(f"{TARGET}.get_cached_client", mock_get_client)
-    monkeypatch.setattr(f"{TARGET}.get_vectorizer", mock_get_vectorizer)
-    monkeypatch.setattr(f"{TARGET}.get_batch_manager", mock_get_batch)
-
-    # Important: Mock search_similar_execution (Standard Search)
-    mock_search_std = MagicMock(return_value=None)
-    monkeypatch.setattr(f"{TARGET}.search_similar_execution", mock_search_std)
-
-    return {
-        "golden_col": mock_golden_col,
-        "search_std": mock_search_std,
-        "batch": mock_batch
-    }
+    for var, token in reversed(tokens):
+        var.reset(token)
 
 
 # --- Tests ---
 
-def test_check_and_return_cached_result_cache_hit_logging(mock_caching_utils_deps):
+def test_check_and_return_cached_result_cache_hit_logging(mock_caching_utils_deps, active_trace_context):
     """
     [Case 1] Verify that DB logging is correctly performed with 'CACHE_HIT' status upon a cache hit.
     """
@@ -115,29 +41,33 @@ def test_check_and_return_cached_result_cache_hit_logging(mock_caching_utils_dep
     # [NEW] Mock Client for Golden Dataset check (Return empty -> fall through to search_similar_execution)
     mock_client = MagicMock()
     mock_client.collections.get.return_value.query.near_vector.return_value.objects = []
+    mock_client.collections.get.return_value.query.fetch_objects.return_value.objects = []
 
     # [FIX] Patch get_cached_client
     with patch("vectorwave.utils.return_caching_utils.get_cached_client", return_value=mock_client):
         with patch("vectorwave.utils.return_caching_utils.search_similar_execution", return_value=mock_cached_log):
-            with patch("vectorwave.utils.return_caching_utils.current_tracer_var") as mock_tracer_var:
-                with patch("vectorwave.utils.return_caching_utils.current_span_id_var") as mock_span_var:
-                    mock_tracer_var.get.return_value = mock_caching_utils_deps["tracer_obj"]
-                    mock_span_var.get.return_value = "parent-span-123"
-
-                    def dummy_func(a, b): pass
-
-                    result = _check_and_return_cached_result(
-                        func=dummy_func,
-                        args=(10,),
-                        kwargs={"b": 20},
-                        function_name="dummy_func",
-                        cache_threshold=0.9,
-                        is_async=False
-                    )
+            active_trace_context(mock_caching_utils_deps["tracer_obj"], "parent-span-123")
+
+            def dummy_func(a, b): pass
+
+            result = _check_and_return_cached_result(
+                func=dummy_func,
+                args=(10,),
+                kwargs={"b": 20},
+                function_name="dummy_func",
+                cache_threshold=0.9,
+                is_async=False
+            )
 
     # Assert
     assert result == {"result": "cached_data"}
 
+    logged = mock_caching_utils_deps["batch_manager"].add_object.call_args.kwargs["properties"]
+    assert logged["status"] == "CACHE_HIT"
+    assert logged["trace_id"] == "existing-trace-id-abc"
+    assert logged["parent_span_id"] == "parent-span-123"
+    assert logged["run_id"] == "test-run-123"
+
 
 def test_check_and_return_cached_result_cache_miss(mock_caching_utils_deps):
     """
@@ -211,3 +141,141 @@ def test_cache_priority_golden_miss_fallback(mock_caching_utils_deps_v2):
     # Both should have been called
     deps["golden_col"].query.near_vector.assert_called_once()
     deps["search_std"].assert_called_once()
+
+
+def test_repeated_input_is_embedded_once(mock_caching_utils_deps_v2):
+    """
+    [Case 5] Identical inputs should reuse the memoized embedding instead of calling the vectorizer again.
+    """
+    deps = mock_caching_utils_deps_v2
+    deps["golden_col"].query.near_vector.return_value.objects = []
+    vectorizer = deps["vectorizer"]
+
+    for _ in range(3):
+        _check_and_return_cached_result(
+            func=lambda q: None, args=(), kwargs={"q": "same"}, function_name="test", cache_threshold=0.9,
+            is_async=False
+        )
+
+    vectorizer.embed.assert_called_once()
+    assert deps["search_std"].call_count == 3
+
+
+def test_cache_hit_uses_precomputed_func_uuid(mock_caching_utils_deps_v2):
+    """
+    [Case 6] A func_uuid passed in by @vectorize should be logged as-is instead of being re-derived.
+    """
+    deps = mock_caching_utils_deps_v2
+    deps["golden_col"].query.near_vector.return_value.objects = []
+    deps["search_std"].return_value = {
+        "return_value": '"StdResult"',
+        "metadata": {"distance": 0.1, "certainty": 0.9},
+        "uuid": "std-1"
+    }
+
+    with patch("vectorwave.utils.return_caching_utils.generate_uuid5") as mock_uuid5:
+        _check_and_return_cached_result(
+            func=lambda: None, args=(), kwargs={}, function_name="test", cache_threshold=0.9, is_async=False,
+            func_uuid="precomputed-uuid"
+        )
+
+    mock_uuid5.assert_not_called()
+    logged = deps["batch"].add_object.call_args.kwargs["properties"]
+    assert logged["function_uuid"] == "precomputed-uuid"
+
+
+def test_cache_hit_log_references_source_without_vector(mock_caching_utils_deps_v2):
+    """
+    [Case 7] CACHE_HIT logs point at the record that served them instead of re-uploading the input vector.
+    """
+    deps = mock_caching_utils_deps_v2
+    deps["golden_col"].query.near_vector.return_value.objects = []
+    deps["search_std"].return_value = {
+        "return_value": '"StdResult"',
+        "metadata": {"distance": 0.1, "certainty": 0.9},
+        "uuid": "std-1"
+    }
+
+    _check_and_return_cached_result(
+        func=lambda: None, args=(), kwargs={}, function_name="test", cache_threshold=0.9, is_async=False
+    )
+
+    call_kwargs = deps["batch"].add_object.call_args.kwargs
+    assert call_kwargs["properties"]["cache_source_uuid"] == "std-1"
+    assert call_kwargs.get("vector") is None
+
+
+def test_cache_hit_logging_can_be_disabled(mock_caching_utils_deps_v2, monkeypatch):
+    """
+    [Case 8] With LOG_CACHE_HITS=False the cached value is still returned, but no CACHE_HIT log is queued.
+    """
+    deps = mock_caching_utils_deps_v2
+    deps["golden_col"].query.near_vector.return_value.objects = []
+    deps["search_std"].return_value = {
+        "return_value": '"StdResult"',
+        "metadata": {"distance": 0.1, "certainty": 0.9},
+        "uuid": "std-1"
+    }
+    monkeypatch.setattr(deps["settings"], "LOG_CACHE_HITS", False)
+
+    result = _check_and_return_cached_result(
+        func=lambda: None, args=(), kwargs={}, function_name="test", cache_threshold=0.9, is_async=False
+    )
+
+    assert result == "StdResult"
+    deps["batch"].add_object.assert_not_called()
+
+
+def test_digest_match_skips_embedding_and_vector_search(mock_caching_utils_deps_v2, monkeypatch):
+    """
+    [Case 9] An exact input-digest match on a SUCCESS log is served without embedding or near_vector.
+    """
+    deps = mock_caching_utils_deps_v2
+    monkeypatch.setattr(deps["settings"], "CACHE_INPUT_DIGEST_PREFILTER", True)
+    match = MagicMock()
+    match.uuid = "exec-1"
+    match.properties = {"return_value": '"DigestResult"'}
+    deps["exec_col"].query.fetch_objects.return_value.objects = [match]
+
+    result = _check_and_return_cached_result(
+        func=lambda: None, args=(), kwargs={"q": "same"}, function_name="test", cache_threshold=0.9, is_async=False
+    )
+
+    assert result == "DigestResult"
+    deps["vectorizer"].embed.assert_not_called()
+    deps["golden_col"].query.near_vector.assert_not_called()
+    deps["search_std"].assert_not_called()
+    assert deps["batch"].add_object.call_args.kwargs["properties"]["cache_source_uuid"] == "exec-1"
+
+
+def test_digest_prefilter_is_off_by_default(mock_caching_utils_deps_v2):
+    deps = mock_caching_utils_deps_v2
+    deps["golden_col"].query.near_vector.return_value.objects = []
+
+    _check_and_return_cached_result(
+        func=lambda: None, args=(), kwargs={"q": "same"}, function_name="test", cache_threshold=0.9, is_async=False
+    )
+
+    deps["exec_col"].query.fetch_objects.assert_not_called()
+    deps["search_std"].assert_called_once()
+
+
+def test_lookup_returns_digest_of_embedded_text_on_miss(mock_caching_utils_deps_v2, monkeypatch):
+    """
+    [Case 11] On a miss the digest of the text that was embedded is handed back for the span.
+    """
+    from vectorwave.utils.input_digest import input_digest64
+    from vectorwave.utils.return_caching_utils import _lookup_cached_result
+
+    deps = mock_caching_utils_deps_v2
+    monkeypatch.setattr(deps["settings"], "CACHE_INPUT_DIGEST_PREFILTER", True)
+    deps["golden_col"].query.near_vector.return_value.objects = []
+    deps["search_std"].return_value = None
+
+    result, digest = _lookup_cached_result(
+        func=lambda: None, args=(), kwargs={"q": "same"}, function_name="test", cache_threshold=0.9, is_async=False
+    )
+
+    assert result is None
+    embedded_text = deps["vectorizer"].embed.call_args.args[0]
+    assert digest == input_digest64(embedded_text)
@@ -0,0 +1,71 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from vectorwave.models.db_config import WeaviateSettings
+from vectorwave.vectorizer import factory
+
+
+@pytest.fixture
+def slow_hf_vectorizer(monkeypatch):
+    """Replaces HuggingFaceVectorizer with a slow-loading fake and resets factory state"""
+    created = []
+
+    class FakeHFVectorizer:
+        def __init__(self, model_name, **kwargs):
+            time.sleep(0.2)
+            self.embed = MagicMock(return_value=[0.0])
+            created.append(self)
+
+    settings = WeaviateSettings(VECTORIZER="huggingface")
+    monkeypatch.setattr(factory, "get_weaviate_settings", lambda: settings)
+    monkeypatch.setattr(factory, "HuggingFaceVectorizer", FakeHFVectorizer)
+    monkeypatch.setattr(factory, "_warmup_thread", None)
+    factory.get_vectorizer.cache_clear()
+
+    yield created
+
+    factory.get_vectorizer.cache_clear()
+
+
+def test_get_vectorizer_waits_for_warmup(slow_hf_vectorizer):
+    """A caller arriving mid-warmup reuses the warmed instance instead of loading a second model"""
+    warmup = factory.start_vectorizer_warmup()
+    assert warmup is not threading.current_thread()
+
+    vectorizer = factory.get_vectorizer()
+
+    assert not warmup.is_alive()
+    assert slow_hf_vectorizer == [vectorizer]
+    vectorizer.embed.assert_called_once_with("warmup")
+
+
+def test_start_vectorizer_warmup_runs_once(slow_hf_vectorizer):
+    first = factory.start_vectorizer_warmup()
+    second = factory.start_vectorizer_warmup()
+    first.join()
+
+    assert first is second
+    assert len(slow_hf_vectorizer) == 1
+
+
+def test_start_vectorizer_warmup_is_safe_under_concurrent_calls(slow_hf_vectorizer):
+    """Concurrent initialize_database() calls share a single warmup thread and model load"""
+    barrier = threading.Barrier(8)
+    started = []
+
+    def start():
+        barrier.wait()
+        started.append(factory.start_vectorizer_warmup())
+
+    callers = [threading.Thread(target=start) for _ in range(8)]
+    for caller in callers:
+        caller.start()
+    for caller in callers:
+        caller.join(timeout=5)
+    started[0].join(timeout=5)
+
+    assert len({id(t) for t in started}) == 1
+    assert len(slow_hf_vectorizer) == 1
@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from vectorwave.vectorizer import huggingface_vectorizer
+from vectorwave.vectorizer.huggingface_vectorizer import HuggingFaceVectorizer
+
+
+@pytest.fixture
+def mock_model(monkeypatch):
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, convert_to_numpy=True: np.array([[float(len(t)), 1.0] for t in texts])
+    monkeypatch.setattr(huggingface_vectorizer, "SentenceTransformer", MagicMock(return_value=model))
+    return model
+
+
+def test_embed_reuses_encoding_for_repeated_text(mock_model):
+    vectorizer = HuggingFaceVectorizer(model_name="test-model")
+
+    first = vectorizer.embed("same query")
+    second = vectorizer.embed("same query")
+
+    assert first == second == [10.0, 1.0]
+    mock_model.encode.assert_called_once()
+
+    # Callers get their own list, so mutating one result does not corrupt the memo
+    first.append(0.0)
+    assert vectorizer.embed("same query") == [10.0, 1.0]
+
+    vectorizer.embed("other")
+    assert mock_model.encode.call_count == 2
+
+
+def test_embed_batch_encodes_in_one_call(mock_model):
+    vectorizer = HuggingFaceVectorizer(model_name="test-model")
+
+    assert vectorizer.embed_batch(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    mock_model.encode.assert_called_once()
+
+
+def test_onnx_backend_is_requested_with_model_file(monkeypatch):
+    mock_st = MagicMock()
+    monkeypatch.setattr(huggingface_vectorizer, "SentenceTransformer", mock_st)
+
+    vectorizer = HuggingFaceVectorizer(
+        model_name="test-model", backend="onnx", model_file_name="onnx/model_qint8_avx512_vnni.onnx"
+    )
+
+    assert vectorizer.backend == "onnx"
+    mock_st.assert_called_once_with(
+        "test-model", device='cpu', backend="onnx",
+        model_kwargs={"file_name": "onnx/model_qint8_avx512_vnni.onnx"}
+    )
+
+
+def test_onnx_backend_falls_back_to_torch(monkeypatch):
+    torch_model = MagicMock()
+
+    def fake_st(model_name, device, backend="torch", model_kwargs=None):
+        if backend != "torch":
+            raise ImportError("optimum is not installed")
+        return torch_model
+
+    monkeypatch.setattr(huggingface_vectorizer, "SentenceTransformer", fake_st)
+
+    vectorizer = HuggingFaceVectorizer(model_name="test-model", backend="onnx")
+
+    assert vectorizer.backend == "torch"
+    assert vectorizer.model is torch_model
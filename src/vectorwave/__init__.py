@@ -2,7 +2,7 @@ from .core.decorator import vectorize
 
 from .database.db import initialize_database
 from .database.db_search import search_functions, search_executions, search_errors_by_message, search_functions_hybrid
-from .monitoring.tracer import trace_span
+from .monitoring.tracer import trace_span, get_last_execution_uuid
 from .search.rag_search import search_and_answer, analyze_trace_log
 from .core.generator import generate_and_register_metadata
 from .utils.healer import VectorWaveHealer
@@ -18,6 +18,7 @@ __all__ = [
     'search_executions',
     'search_errors_by_message',
     'trace_span',
+    'get_last_execution_uuid',
     'search_and_answer',
     'analyze_trace_log',
     'generate_and_register_metadata',
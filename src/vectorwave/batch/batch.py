@@ -70,13 +70,24 @@ class WeaviateBatchManager:
         last_flush_time = time.time()
 
         while not self._stop_event.is_set():
+            flush_marker = None
             try:
                 # Non-blocking get or wait for a short time
                 item = self.queue.get(timeout=0.5)
-                pending_items.append(item)
+                if isinstance(item, threading.Event):
+                    flush_marker = item  # Queued by flush(): everything before it is in pending_items
+                else:
+                    pending_items.append(item)
             except queue.Empty:
                 pass
 
+            if flush_marker is not None:
+                self._flush_batch(pending_items)
+                pending_items = []
+                last_flush_time = time.time()
+                flush_marker.set()
+                continue
+
             current_time = time.time()
             time_since_flush = current_time - last_flush_time
 
@@ -86,6 +97,10 @@ class WeaviateBatchManager:
                 pending_items = [] # Clear buffer
                 last_flush_time = current_time
 
+        # Stop requested: send what was already taken off the queue instead of dropping it
+        if pending_items:
+            self._flush_batch(pending_items)
+
     def _flush_batch(self, items: List[Dict[str, Any]]):
         """
         Sends a list of items to Weaviate. Handles re-connection if needed.
@@ -141,6 +156,22 @@ class WeaviateBatchManager:
         except queue.Full:
             logger.warning("🚨 VectorWave Log Queue is FULL. Dropping log.")
 
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        [Blocking] Waits until every object queued before this call has been sent to Weaviate.
+        Returns False if the worker did not finish within 'timeout' seconds.
+        """
+        if self._stop_event.is_set() or not (self._worker_thread and self._worker_thread.is_alive()):
+            return False
+
+        flush_marker = threading.Event()
+        try:
+            self.queue.put(flush_marker, timeout=timeout)
+        except queue.Full:
+            logger.warning("VectorWave Log Queue is FULL. Flush request timed out.")
+            return False
+        return flush_marker.wait(timeout)
+
     def shutdown(self):
         """Gracefully shuts down. Called by atexit."""
         if not self._stop_event.is_set():
@@ -154,7 +185,11 @@ class WeaviateBatchManager:
             remaining_items = []
             try:
                 while not self.queue.empty():
-                    remaining_items.append(self.queue.get_nowait())
+                    item = self.queue.get_nowait()
+                    if isinstance(item, threading.Event):
+                        item.set()  # Release any flush() waiter
+                    else:
+                        remaining_items.append(item)
             except queue.Empty:
                 pass
 
@@ -173,4 +208,12 @@ class WeaviateBatchManager:
 
 @lru_cache(None)
 def get_batch_manager() -> WeaviateBatchManager:
-    return WeaviateBatchManager()
\ No newline at end of file
+    return WeaviateBatchManager()
+
+
+def flush_pending(timeout: float = 10.0) -> bool:
+    """
+    Blocks until all queued logs have been written to Weaviate (or 'timeout' expires).
+    Use instead of sleeping when a script needs its logs to be queryable right away.
+    """
+    return get_batch_manager().flush(timeout=timeout)
@@ -1,17 +1,22 @@
+import asyncio
 import inspect
 import logging
 from functools import wraps
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 
 from weaviate.util import generate_uuid5
 
 from ..batch.batch import get_batch_manager
 from ..models.db_config import get_weaviate_settings
-from ..monitoring.tracer import trace_root, trace_span
+from ..monitoring.tracer import trace_root, trace_span, _create_input_vector_data, _should_embed_input
 from ..utils.function_cache import function_cache_manager
-from ..utils.return_caching_utils import _check_and_return_cached_result
+from ..utils.return_caching_utils import (
+    _lookup_cached_result, _ExactMatchCache, _remember_result
+)
 from ..vectorizer.factory import get_vectorizer
-from ..utils.context import execution_source_context
+from ..utils.context import (
+    execution_source_context, precomputed_vectors_context, last_execution_uuid_context, input_digest_context
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +31,12 @@ def vectorize(search_description: Optional[str] = None,
               cache_threshold: float = 0.9,
               replay: bool = False,
               attributes_to_capture: Optional[List[str]] = None,
+              embed_predicate: Optional[Callable[..., bool]] = None,
               **execution_tags):
     """
     VectorWave Decorator with Auto-Generation support.
+    'embed_predicate' is called with the function's own arguments; returning False
+    logs that call without an input vector (skips the embedding model).
     """
 
     if semantic_cache:
@@ -45,6 +53,9 @@ def vectorize(search_description: Optional[str] = None,
     if replay and not capture_return_value:
         capture_return_value = True
 
+    # A falsy threshold can never produce a hit, so skip the cache check call entirely.
+    check_cache = semantic_cache and bool(cache_threshold)
+
     def decorator(func):
         is_async_func = inspect.iscoroutinefunction(func)
 
@@ -139,51 +150,137 @@ def vectorize(search_description: Optional[str] = None,
 
         # --- Wrapper Logic ---
 
+        # Opt-in via CACHE_EXACT_MEMO_TTL_SECONDS > 0 (memo hits are not traced)
+        exact_memo_ttl = get_weaviate_settings().CACHE_EXACT_MEMO_TTL_SECONDS
+        exact_cache = _ExactMatchCache(ttl_seconds=exact_memo_ttl) if check_cache and exact_memo_ttl > 0 else None
+
+        def _strip_injected_kwargs(kwargs):
+            return {k: v for k, v in kwargs.items() if
+                    k not in valid_execution_tags and k != 'function_uuid' and k != 'exec_source'}
+
+        # The span sees the injected tags; the user's predicate only gets the function's own arguments
+        span_embed_predicate = (
+            (lambda *args, **kwargs: embed_predicate(*args, **_strip_injected_kwargs(kwargs)))
+            if embed_predicate is not None else None
+        )
+
+        def _with_injected_kwargs(kwargs):
+            full_kwargs = kwargs.copy()
+            full_kwargs.update(valid_execution_tags)
+            full_kwargs['function_uuid'] = func_uuid
+            full_kwargs['exec_source'] = execution_source_context.get()
+            return full_kwargs
+
+        def _split_batch_calls(kwarg_lists):
+            if len({len(values) for values in kwarg_lists.values()}) > 1:
+                raise ValueError("All keyword lists passed to .batch() must have the same length.")
+            return [dict(zip(kwarg_lists, values)) for values in zip(*kwarg_lists.values())]
+
+        def _precompute_vectors(calls) -> Optional[Dict[str, List[float]]]:
+            """Embeds the span input text of every call in one embed_batch call."""
+            vectorizer = get_vectorizer() if capture_return_value else None
+            calls = [call for call in calls if _should_embed_input(embed_predicate, function_name, (), call)]
+            if not vectorizer or not calls:
+                return None
+            texts = [
+                _create_input_vector_data(
+                    function_name, (), _with_injected_kwargs(call), settings.sensitive_keys
+                )['text']
+                for call in calls
+            ]
+            try:
+                vectors = vectorizer.embed_batch(texts)
+                return {text: vec for text, vec in zip(texts, vectors) if vec}
+            except Exception as e:
+                logger.warning(f"Batch vectorization failed for '{function_name}', embedding per call: {e}")
+                return None
+
         if is_async_func:
             @trace_root()
-            @trace_span(attributes_to_capture=final_attributes, capture_return_value=capture_return_value)
+            @trace_span(attributes_to_capture=final_attributes, capture_return_value=capture_return_value,
+                        embed_predicate=span_embed_predicate)
             @wraps(func)
             async def inner_wrapper(*args, **kwargs):
                 # Remove injected tags from kwargs before calling original func
-                clean_kwargs = {k: v for k, v in kwargs.items() if
-                                k not in valid_execution_tags and k != 'function_uuid' and k != 'exec_source'}
-                return await func(*args, **clean_kwargs)
+                return await func(*args, **_strip_injected_kwargs(kwargs))
 
             @wraps(func)
             async def outer_wrapper(*args, **kwargs):
-                if semantic_cache:
-                    cached = _check_and_return_cached_result(func, args, kwargs, function_name, cache_threshold, True)
+                last_execution_uuid_context.set(None)
+                input_digest = None
+                if check_cache:
+                    cached, input_digest = _lookup_cached_result(func, args, kwargs, function_name, cache_threshold,
+                                                                 True, func_uuid=func_uuid, exact_cache=exact_cache)
                     if cached is not None: return cached
 
-                full_kwargs = kwargs.copy()
-                full_kwargs.update(valid_execution_tags)
-                full_kwargs['function_uuid'] = func_uuid
-                full_kwargs['exec_source'] = execution_source_context.get()
-                return await inner_wrapper(*args, **full_kwargs)
+                full_kwargs = _with_injected_kwargs(kwargs)
+                digest_token = input_digest_context.set(input_digest)
+                try:
+                    result = await inner_wrapper(*args, **full_kwargs)
+                finally:
+                    input_digest_context.reset(digest_token)
+                if check_cache:
+                    _remember_result(exact_cache, args, kwargs, result)
+                return result
 
+            async def batch(**kwarg_lists) -> List[Any]:
+                """
+                Async .batch(): embeds all inputs in one call, then runs the calls
+                concurrently with asyncio.gather (results keep the input order).
+                e.g. await product_inquiry.batch(query=["q1", "q2"])
+                """
+                calls = _split_batch_calls(kwarg_lists)
+                # Tasks copy the current context, so each call sees the precomputed vectors
+                token = precomputed_vectors_context.set(_precompute_vectors(calls))
+                try:
+                    return list(await asyncio.gather(*(outer_wrapper(**call) for call in calls)))
+                finally:
+                    precomputed_vectors_context.reset(token)
+
+            outer_wrapper.batch = batch
             return outer_wrapper
 
         else:  # Sync wrapper
             @trace_root()
-            @trace_span(attributes_to_capture=final_attributes, capture_return_value=capture_return_value)
+            @trace_span(attributes_to_capture=final_attributes, capture_return_value=capture_return_value,
+                        embed_predicate=span_embed_predicate)
             @wraps(func)
             def inner_wrapper(*args, **kwargs):
-                clean_kwargs = {k: v for k, v in kwargs.items() if
-                                k not in valid_execution_tags and k != 'function_uuid' and k != 'exec_source'}
-                return func(*args, **clean_kwargs)
+                return func(*args, **_strip_injected_kwargs(kwargs))
 
             @wraps(func)
             def outer_wrapper(*args, **kwargs):
-                if semantic_cache:
-                    cached = _check_and_return_cached_result(func, args, kwargs, function_name, cache_threshold, False)
+                last_execution_uuid_context.set(None)
+                input_digest = None
+                if check_cache:
+                    cached, input_digest = _lookup_cached_result(func, args, kwargs, function_name, cache_threshold,
+                                                                 False, func_uuid=func_uuid, exact_cache=exact_cache)
                     if cached is not None: return cached
 
-                full_kwargs = kwargs.copy()
-                full_kwargs.update(valid_execution_tags)
-                full_kwargs['function_uuid'] = func_uuid
-                full_kwargs['exec_source'] = execution_source_context.get()
-                return inner_wrapper(*args, **full_kwargs)
+                full_kwargs = _with_injected_kwargs(kwargs)
+                digest_token = input_digest_context.set(input_digest)
+                try:
+                    result = inner_wrapper(*args, **full_kwargs)
+                finally:
+                    input_digest_context.reset(digest_token)
+                if check_cache:
+                    _remember_result(exact_cache, args, kwargs, result)
+                return result
+
+            def batch(**kwarg_lists) -> List[Any]:
+                """
+                Calls the function once per item of the given keyword lists,
+                embedding all inputs with a single embed_batch call.
+                e.g. product_inquiry.batch(query=["q1", "q2"])
+                """
+                calls = _split_batch_calls(kwarg_lists)
+                token = precomputed_vectors_context.set(_precompute_vectors(calls))
+                try:
+                    return [outer_wrapper(**call) for call in calls]
+                finally:
+                    precomputed_vectors_context.reset(token)
 
+            outer_wrapper.batch = batch
             return outer_wrapper
 
     return decorator
\ No newline at end of file
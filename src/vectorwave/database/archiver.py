@@ -4,6 +4,7 @@ from typing import Dict, Any, List
 import weaviate.classes.query as wvc_query  # Using Weaviate v4 filters
 from .db import get_cached_client           # Import within the same package
 from ..models.db_config import get_weaviate_settings
+from ..utils.return_caching_utils import invalidate_exact_caches
 
 class VectorWaveArchiver:
     def __init__(self):
@@ -72,6 +73,7 @@ class VectorWaveArchiver:
                     where=wvc_query.Filter.by_id().contains_any(uuids_to_delete)
                 )
                 deleted_count = result.successful
+                invalidate_exact_caches()
                 print(f"🗑️ [Clear] {deleted_count} records deleted from DB.")
             except Exception as e:
                 print(f"❌ [Error] DB deletion failed: {e}")
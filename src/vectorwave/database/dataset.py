@@ -1,15 +1,16 @@
 # src/vectorwave/database/dataset.py
 import logging
 import uuid
-import math
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 
+import numpy as np
 import weaviate.classes.query as wvc_query
 from weaviate.util import generate_uuid5
 
 from .db import get_cached_client
 from ..models.db_config import get_weaviate_settings
+from ..utils.return_caching_utils import invalidate_exact_caches
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,12 @@ class VectorWaveDatasetManager:
         self.settings = get_weaviate_settings()
         self.exec_col = self.client.collections.get(self.settings.EXECUTION_COLLECTION_NAME)
         self.golden_col = self.client.collections.get(self.settings.GOLDEN_COLLECTION_NAME)
+        # function_name -> (centroid, avg_distance, golden_origin_ids, golden_matrix, golden_sq_norms);
+        # cleared on register_as_golden
+        self._golden_stats_cache: Dict[str, Tuple[np.ndarray, float, Set[str], np.ndarray, np.ndarray]] = {}
+        # function_name -> {candidate uuid: (distance to the cached centroid, distance to the nearest golden)}
+        # for the latest call's candidates only; cleared with the golden stats
+        self._distance_cache: Dict[str, Dict[str, Tuple[float, float]]] = {}
 
     def register_as_golden(self, log_uuid: str, note: str = "", tags: List[str] = None) -> bool:
         """
@@ -41,6 +48,11 @@ class VectorWaveDatasetManager:
                 logger.error(f"Log UUID '{log_uuid}' not found.")
                 return False
 
+            vector = (log_obj.vector or {}).get("default")
+            if vector is None:
+                logger.error(f"Log UUID '{log_uuid}' has no stored vector (e.g. a CACHE_HIT log). Register its source log instead.")
+                return False
+
             props = log_obj.properties
 
             # 2. Configure Golden Data properties
@@ -49,6 +61,7 @@ class VectorWaveDatasetManager:
                 "function_name": props.get("function_name"),
                 "function_uuid": props.get("function_uuid"),
                 "return_value": props.get("return_value"),
+                "input_digest": props.get("input_digest"),
                 "note": note,
                 "created_at": datetime.now(timezone.utc).isoformat(),
                 "tags": tags if tags else []
@@ -57,9 +70,12 @@ class VectorWaveDatasetManager:
             # 3. Save (reuse original vector)
             self.golden_col.data.insert(
                 properties=golden_props,
-                vector=log_obj.vector["default"],  # Copy vector
+                vector=vector,  # Copy vector
                 uuid=generate_uuid5(log_uuid)  # Regenerate to avoid UUID collision, or maintain relation with original
             )
+            self._golden_stats_cache.pop(props.get("function_name"), None)
+            self._distance_cache.pop(props.get("function_name"), None)
+            invalidate_exact_caches()
             logger.info(f"✅ Registered log {log_uuid} as Golden Data.")
             return True
 
@@ -67,11 +83,16 @@ class VectorWaveDatasetManager:
             logger.error(f"Failed to register golden data: {e}")
             return False
 
-    def recommend_candidates(self, function_name: str, limit: int = 5) -> List[Dict[str, Any]]:
+    def _get_golden_stats(
+            self, function_name: str
+    ) -> Optional[Tuple[np.ndarray, float, Set[str], np.ndarray, np.ndarray]]:
         """
-        [Issue #80] Density-Based Recommendation Logic.
-        Analyzes the vector distribution of existing Golden Data to suggest new candidates.
+        Returns (centroid, avg_distance, golden_origin_ids, golden_matrix, golden_sq_norms) for the function's Golden Data,
+        fetching and computing them only on the first call.
         """
+        if function_name in self._golden_stats_cache:
+            return self._golden_stats_cache[function_name]
+
         # 1. Fetch all vectors from Golden Data
         golden_objs = self.golden_col.query.fetch_objects(
             filters=wvc_query.Filter.by_property("function_name").equal(function_name),
@@ -80,30 +101,44 @@ class VectorWaveDatasetManager:
         ).objects
 
         if not golden_objs:
-            logger.info("No Golden Data found. Cannot calculate density.")
-            return []
+            return None
 
         # 2. Calculate Centroid and Density (Average Distance)
-        vectors = [obj.vector["default"] for obj in golden_objs]
-        if not vectors: return []
+        golden_matrix = np.asarray([obj.vector["default"] for obj in golden_objs], dtype=np.float32)
+        centroid = golden_matrix.mean(axis=0)
 
-        dim = len(vectors[0])
-        centroid = [sum(col) / len(vectors) for col in zip(*vectors)]
+        # Euclidean distance between each vector and Centroid, in a single pass
+        distances = np.linalg.norm(golden_matrix - centroid, axis=1)
+        avg_distance = float(distances.mean())  # This becomes the 'reference density'
 
-        # Calculate Euclidean distance between each vector and Centroid
-        distances = []
-        for v in vectors:
-            dist = math.dist(v, centroid)
-            distances.append(dist)
+        logger.info(f"[{function_name}] Golden Density (Avg Dist): {avg_distance:.4f}")
 
-        avg_distance = sum(distances) / len(distances)  # This becomes the 'reference density'
+        golden_origin_ids = {obj.properties.get("original_uuid") for obj in golden_objs}
+        # float64 copy + squared row norms for the nearest-golden GEMM; in float32 the
+        # |c|^2 + |g|^2 - 2c.g expansion cancels badly for near-identical vectors
+        golden_matrix64 = golden_matrix.astype(np.float64)
+        golden_sq_norms = np.einsum("kd,kd->k", golden_matrix64, golden_matrix64)
+        stats = (centroid, avg_distance, golden_origin_ids, golden_matrix64, golden_sq_norms)
+        self._golden_stats_cache[function_name] = stats
+        return stats
 
-        logger.info(f"[{function_name}] Golden Density (Avg Dist): {avg_distance:.4f}")
+    def recommend_candidates(self, function_name: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        [Issue #80] Density-Based Recommendation Logic.
+        Analyzes the vector distribution of existing Golden Data to suggest new candidates.
+        """
+        # 1~2. Centroid and Density of Golden Data (cached per function)
+        golden_stats = self._get_golden_stats(function_name)
+        if golden_stats is None:
+            logger.info("No Golden Data found. Cannot calculate density.")
+            return []
+
+        centroid, avg_distance, golden_origin_ids, golden_matrix, golden_sq_norms = golden_stats
 
         # 3. Search candidates (successful cases from standard execution logs)
         # Exclude logs already registered as Golden (Filtering by original_uuid is complex, so handle in memory)
         candidates = self.exec_col.query.near_vector(
-            near_vector=centroid,  # Fetch closest to centroid first
+            near_vector=centroid.tolist(),  # Fetch closest to centroid first
             limit=limit * 5,
             filters=(
                     wvc_query.Filter.by_property("function_name").equal(function_name) &
@@ -113,36 +148,60 @@ class VectorWaveDatasetManager:
             include_vector=True
         ).objects
 
-        golden_origin_ids = {obj.properties.get("original_uuid") for obj in golden_objs}
-
-        recommendations = []
+        candidates = [cand for cand in candidates if str(cand.uuid) not in golden_origin_ids]
+        if not candidates:
+            return []
 
         # 4. Classification Logic (Steady vs Discovery)
         steady_limit = avg_distance + self.settings.RECOMMENDATION_STEADY_MARGIN
         discovery_limit = steady_limit + self.settings.RECOMMENDATION_DISCOVERY_MARGIN
 
-        for cand in candidates:
-            if str(cand.uuid) in golden_origin_ids:
+        # Weaviate near_vector distance is usually Cosine Distance (0~2) or Euclidean
+        # Here, use the distance calculated directly with the Centroid.
+        # Only candidates not seen since the last golden change are computed; the rest are reused.
+        known = self._distance_cache.setdefault(function_name, {})
+        new_cands = [cand for cand in candidates if str(cand.uuid) not in known]
+        if new_cands:
+            new_matrix = np.asarray([cand.vector["default"] for cand in new_cands], dtype=np.float32)
+            new_distances = np.linalg.norm(new_matrix - centroid, axis=1)
+
+            # Distance to the nearest golden for all (candidate, golden) pairs with one matrix product:
+            # |c - g|^2 = |c|^2 + |g|^2 - 2 c.g
+            new_matrix64 = new_matrix.astype(np.float64)
+            sq_distances = (np.einsum("nd,nd->n", new_matrix64, new_matrix64)[:, None]
+                            + golden_sq_norms[None, :] - 2.0 * (new_matrix64 @ golden_matrix.T))
+            nearest_distances = np.sqrt(np.maximum(sq_distances.min(axis=1), 0.0))
+
+            known.update(zip((str(cand.uuid) for cand in new_cands),
+                             zip(new_distances.tolist(), nearest_distances.tolist())))
+
+        # Keep only this call's candidates so the cache doesn't grow with every log ever seen
+        known = {str(cand.uuid): known[str(cand.uuid)] for cand in candidates}
+        self._distance_cache[function_name] = known
+
+        cand_distances = np.fromiter((known[str(cand.uuid)][0] for cand in candidates), dtype=np.float64,
+                                     count=len(candidates))
+
+        # Steady: Located within existing data distribution
+        # Discovery: Slightly outside existing distribution (Potential new pattern)
+        rec_types = np.where(
+            cand_distances <= steady_limit, "STEADY",
+            np.where(cand_distances <= discovery_limit, "DISCOVERY", "IGNORE")
+        )
+
+        recommendations = []
+        for cand, rec_type, dist_to_centroid in zip(candidates, rec_types, cand_distances):
+            if rec_type == "IGNORE":
                 continue
 
-            # Weaviate near_vector distance is usually Cosine Distance (0~2) or Euclidean
-            # Here, use the distance calculated directly with the Centroid
-            dist_to_centroid = math.dist(cand.vector["default"], centroid)
-
-            rec_type = "IGNORE"
-            if dist_to_centroid <= steady_limit:
-                rec_type = "STEADY"  # Steady: Located within existing data distribution
-            elif steady_limit < dist_to_centroid <= discovery_limit:
-                rec_type = "DISCOVERY"  # Discovery: Slightly outside existing distribution (Potential new pattern)
-
-            if rec_type != "IGNORE":
-                recommendations.append({
-                    "uuid": str(cand.uuid),
-                    "type": rec_type,
-                    "distance_to_center": dist_to_centroid,
-                    "avg_density": avg_distance,
-                    "return_value": cand.properties.get("return_value")
-                })
+            recommendations.append({
+                "uuid": str(cand.uuid),
+                "type": str(rec_type),
+                "distance_to_center": float(dist_to_centroid),
+                "distance_to_nearest_golden": known[str(cand.uuid)][1],
+                "avg_density": avg_distance,
+                "return_value": cand.properties.get("return_value")
+            })
 
             if len(recommendations) >= limit:
                 break
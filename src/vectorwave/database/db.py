@@ -1,4 +1,6 @@
+import atexit
 import logging
+import time
 from functools import lru_cache
 
 import weaviate
@@ -10,7 +12,7 @@ from vectorwave.exception.exceptions import (
 )
 from vectorwave.models.db_config import WeaviateSettings
 from vectorwave.models.db_config import get_weaviate_settings
-from weaviate.config import AdditionalConfig
+from weaviate.config import AdditionalConfig, Timeout
 from weaviate.exceptions import WeaviateConnectionError as WeaviateClientConnectionError
 
 # Create module-level logger
@@ -38,7 +40,12 @@ def get_weaviate_client(settings: WeaviateSettings) -> weaviate.WeaviateClient:
             additional_config=AdditionalConfig(
                 dynamic=True,
                 batch_size=20,
-                timeout_retries=3
+                timeout_retries=3,
+                timeout=Timeout(
+                    init=settings.WEAVIATE_TIMEOUT_INIT,
+                    query=settings.WEAVIATE_TIMEOUT_QUERY,
+                    insert=settings.WEAVIATE_TIMEOUT_INSERT
+                )
             )
         )
     except WeaviateClientConnectionError as e:
@@ -58,10 +65,13 @@ def get_cached_client() -> weaviate.WeaviateClient:
     """
     Singleton factory: Gets settings and returns a single client instance.
     This function IS cached.
+    The client keeps its HTTP keep-alive pool and gRPC channel open for the whole
+    process and is closed once at exit, so callers don't need to close it themselves.
     """
     logger.debug("Creating and caching new Weaviate client instance")
     settings = get_weaviate_settings()
     client = get_weaviate_client(settings)
+    atexit.register(client.close)
     return client
 
 
@@ -287,6 +297,16 @@ def create_execution_schema(client: weaviate.WeaviateClient, settings: WeaviateS
             name="exec_source",
             data_type=wvc.DataType.TEXT,
             description="Source of execution: 'REALTIME' (User traffic) or 'REPLAY' (Regression Test)"
+        ),
+        wvc.Property(
+            name="cache_source_uuid",
+            data_type=wvc.DataType.TEXT,
+            description="For CACHE_HIT logs: UUID of the Golden/Execution record that served the cached result"
+        ),
+        wvc.Property(
+            name="input_digest",
+            data_type=wvc.DataType.INT,
+            description="64-bit digest of the vectorized input text, used as an exact-match cache prefilter"
         )
     ]
 
@@ -318,11 +338,19 @@ def create_execution_schema(client: weaviate.WeaviateClient, settings: WeaviateS
             except Exception as e:
                 logger.warning("Skipping custom property '%s' for '%s': %s", name, collection_name, e)
 
+    vector_index_config = None
+    if settings.EXECUTION_VECTOR_QUANTIZATION:
+        # int8 SQ cuts index memory ~4x; rescoring with the original vectors keeps cache/drift distances accurate
+        vector_index_config = wvc.Configure.VectorIndex.hnsw(
+            quantizer=wvc.Configure.VectorIndex.Quantizer.sq(rescore_limit=settings.EXECUTION_SQ_RESCORE_LIMIT)
+        )
+
     try:
         execution_collection = client.collections.create(
             name=collection_name,
             properties=properties,
             vectorizer_config=wvc.Configure.Vectorizer.none(),
+            vector_index_config=vector_index_config,
         )
         logger.info("Collection '%s' created successfully", collection_name)
         return execution_collection
@@ -349,6 +377,8 @@ def create_golden_dataset_schema(client: weaviate.WeaviateClient, settings: Weav
         wvc.Property(name="function_uuid", data_type=wvc.DataType.UUID),
 
         wvc.Property(name="return_value", data_type=wvc.DataType.TEXT),
+        wvc.Property(name="input_digest", data_type=wvc.DataType.INT,
+                     description="Input digest of the original log, copied from the execution log"),
 
         wvc.Property(name="note", data_type=wvc.DataType.TEXT, description="User notes or reason for selection"),
         wvc.Property(name="created_at", data_type=wvc.DataType.DATE),
@@ -399,8 +429,13 @@ def initialize_database():
     """
     Helper function to initialize both the client and the two schemas.
     """
+    # Imported here to avoid a circular import (vectorizer -> llm client -> batch -> db)
+    from vectorwave.vectorizer.factory import start_vectorizer_warmup
+
     try:
         settings = get_weaviate_settings()
+        # Load the embedding model while the client connects
+        start_vectorizer_warmup()
         client = get_cached_client()
         if client:
             create_vectorwave_schema(client, settings)
@@ -411,3 +446,32 @@ def initialize_database():
     except Exception as e:
         logger.error("Failed to initialize VectorWave database: %s", e)
         return None
+
+
+def count_objects(collection_name: str) -> int:
+    """
+    Returns the total number of objects stored in the given collection.
+    """
+    collection = get_cached_client().collections.get(collection_name)
+    return collection.aggregate.over_all(total_count=True).total_count or 0
+
+
+def wait_for_indexed(collection_name: str, expected_count: int, timeout: float = 15.0, poll: float = 0.1) -> bool:
+    """
+    Polls the collection until it holds at least `expected_count` objects.
+    Returns False (instead of raising) if the timeout is reached first.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if count_objects(collection_name) >= expected_count:
+                return True
+        except Exception as e:
+            logger.debug("Count query for '%s' failed while waiting: %s", collection_name, e)
+
+        if time.monotonic() >= deadline:
+            logger.warning(
+                "Timed out after %.1fs waiting for %d objects in '%s'", timeout, expected_count, collection_name
+            )
+            return False
+        time.sleep(poll)
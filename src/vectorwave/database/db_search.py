@@ -10,6 +10,7 @@ from ..models.db_config import get_weaviate_settings, WeaviateSettings
 from .db import get_cached_client
 from ..exception.exceptions import WeaviateConnectionError
 from ..vectorizer.factory import get_vectorizer
+from ..monitoring.drift import get_baseline, score_against_baseline
 from weaviate.classes.aggregate import Metrics
 
 import uuid
@@ -372,9 +373,23 @@ def check_semantic_drift(
 ) -> Tuple[bool, float, Optional[str]]:
     """
     KNN based semantic drift check.
+    With DRIFT_USE_BASELINE, a function with a finalized baseline (see monitoring.drift.finalize_baseline)
+    is z-scored against it instead, without a DB query.
     """
     try:
         settings = get_weaviate_settings()
+
+        baseline = get_baseline(function_name) if settings.DRIFT_USE_BASELINE else None
+        if baseline is not None:
+            distance, z_score = score_against_baseline(vector, baseline)
+            is_drift = z_score > settings.DRIFT_Z_THRESHOLD
+            if is_drift:
+                logger.warning(
+                    f"🚨 [Semantic Drift] '{function_name}' detected anomaly! "
+                    f"Baseline Distance: {distance:.4f} (z={z_score:.2f}, Threshold: {settings.DRIFT_Z_THRESHOLD})"
+                )
+            return is_drift, distance, None
+
         client = get_cached_client()
         collection = client.collections.get(settings.EXECUTION_COLLECTION_NAME)
 
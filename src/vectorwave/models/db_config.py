@@ -20,6 +20,10 @@ class WeaviateSettings(BaseSettings):
     WEAVIATE_HOST: str = "localhost"
     WEAVIATE_PORT: int = 8080
     WEAVIATE_GRPC_PORT: int = 50051
+    # Client timeouts in seconds (connection setup, queries, inserts)
+    WEAVIATE_TIMEOUT_INIT: int = 30
+    WEAVIATE_TIMEOUT_QUERY: int = 30
+    WEAVIATE_TIMEOUT_INSERT: int = 90
     COLLECTION_NAME: str = "VectorWaveFunctions"
     EXECUTION_COLLECTION_NAME: str = "VectorWaveExecutions"
     GOLDEN_COLLECTION_NAME: str = "VectorWaveGoldenDataset"
@@ -32,12 +36,30 @@ class WeaviateSettings(BaseSettings):
     BATCH_THRESHOLD: int = 20
     FLUSH_INTERVAL_SECONDS: float = 2.0
 
+    # Write a CACHE_HIT log for each semantic cache hit
+    LOG_CACHE_HITS: bool = True
+    # Lifetime of the in-process exact-argument memo in front of the semantic cache (0 = disabled).
+    # Memo hits skip embedding and vector search, but also the function's span: no SUCCESS log,
+    # no drift check, and the CACHE_HIT log has no cache_source_uuid for results memoized from a fresh run.
+    CACHE_EXACT_MEMO_TTL_SECONDS: float = 0.0
+    # Store an exact digest of the cache input and look it up before embedding + vector search.
+    # Costs up to two extra DB queries on a miss, so it only pays off for frequently repeated inputs.
+    CACHE_INPUT_DIGEST_PREFILTER: bool = False
+
+    # Scalar (int8) quantization of the execution collection's HNSW index (requires Weaviate >= 1.26)
+    EXECUTION_VECTOR_QUANTIZATION: bool = True
+    EXECUTION_SQ_RESCORE_LIMIT: int = 200
+
     WEAVIATE_VECTORIZER_MODULE: str = "text2vec-openai"
 
     WEAVIATE_GENERATIVE_MODULE: str = "generative-openai"
 
     OPENAI_API_KEY: Optional[str] = None
     HF_MODEL_NAME: str = "sentence-transformers/all-MiniLM-L6-v2"
+    # "torch", "onnx" or "openvino". e.g. HF_BACKEND=onnx with
+    # HF_MODEL_FILE_NAME=onnx/model_qint8_avx512_vnni.onnx for the int8-quantized ONNX export
+    HF_BACKEND: str = "torch"
+    HF_MODEL_FILE_NAME: Optional[str] = None
 
     CUSTOM_PROPERTIES_FILE_PATH: str = ".weaviate_properties"
     FAILURE_MAPPING_FILE_PATH: str = ".vectorwave_errors.json"
@@ -53,6 +75,12 @@ class WeaviateSettings(BaseSettings):
     DRIFT_DETECTION_ENABLED: bool = False
     DRIFT_DISTANCE_THRESHOLD: float = 0.25
     DRIFT_NEIGHBOR_AMOUNT: int = 5
+    # Opt-in: z-score inputs against a baseline from monitoring.drift.finalize_baseline
+    # (DRIFT_Z_THRESHOLD) instead of the KNN query (DRIFT_DISTANCE_THRESHOLD)
+    DRIFT_USE_BASELINE: bool = False
+    DRIFT_Z_THRESHOLD: float = 3.0
+    DRIFT_BASELINE_MIN_SAMPLES: int = 30
+    DRIFT_BASELINE_FILE_PATH: str = ".vectorwave_drift_baseline.json"
 
     RECOMMENDATION_STEADY_MARGIN: float = 0.05
     RECOMMENDATION_DISCOVERY_MARGIN: float = 0.15
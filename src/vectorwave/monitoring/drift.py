@@ -0,0 +1,187 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
+import weaviate.classes.query as wvc_query
+
+from ..database.db import get_cached_client
+from ..models.db_config import get_weaviate_settings, WeaviateSettings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored stats change meaning; entries with another version are ignored
+BASELINE_VERSION = 2
+
+# Floor for sigma (cosine distance units). Without it a tight baseline z-scores
+# every slightly new input as drift.
+_MIN_SIGMA = 0.02
+
+# function_name -> baseline entry, plus the file mtime it was loaded at
+_baselines: Optional[Dict[str, Dict[str, Any]]] = None
+_baselines_mtime: Optional[float] = None
+_baselines_lock = threading.Lock()
+
+
+def _embedding_signature(settings: WeaviateSettings) -> str:
+    """Identifies the embedding space; baselines built with another model are discarded."""
+    vectorizer_name = settings.VECTORIZER.lower()
+    if vectorizer_name == "huggingface":
+        return f"{vectorizer_name}:{settings.HF_MODEL_NAME}"
+    return vectorizer_name
+
+
+def _baseline_path() -> str:
+    return get_weaviate_settings().DRIFT_BASELINE_FILE_PATH
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def _is_current(entry: Dict[str, Any], signature: str) -> bool:
+    return entry.get("version") == BASELINE_VERSION and entry.get("embedding") == signature
+
+
+def _load_baselines() -> Dict[str, Dict[str, Any]]:
+    """
+    Loads the baseline file, re-reading it whenever it changes on disk so baselines
+    finalized or cleared by another process are picked up.
+    Entries from another format version or embedding model are dropped.
+    """
+    global _baselines, _baselines_mtime
+    path = _baseline_path()
+    mtime = _file_mtime(path)
+    with _baselines_lock:
+        if _baselines is not None and mtime == _baselines_mtime:
+            return _baselines
+
+        _baselines = {}
+        _baselines_mtime = mtime
+        if mtime is None:
+            return _baselines
+
+        signature = _embedding_signature(get_weaviate_settings())
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for name, entry in json.load(f).items():
+                    if not _is_current(entry, signature):
+                        logger.info(f"Ignoring stale drift baseline for '{name}' (version/model changed).")
+                        continue
+                    entry["centroid"] = np.asarray(entry["centroid"], dtype=np.float32)
+                    _baselines[name] = entry
+        except (IOError, json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load drift baselines. Starting clean. Error: {e}")
+            _baselines = {}
+        return _baselines
+
+
+def _save_baselines(baselines: Dict[str, Dict[str, Any]]):
+    global _baselines_mtime
+    path = _baseline_path()
+    serializable = {
+        name: {**entry, "centroid": entry["centroid"].tolist()}
+        for name, entry in baselines.items()
+    }
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(serializable, f)
+        _baselines_mtime = _file_mtime(path)
+    except IOError as e:
+        logger.error(f"Failed to save drift baselines. Error: {e}")
+
+
+def finalize_baseline(function_name: str, limit: int = 1000,
+                      min_samples: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Computes the drift baseline (centroid, mu, sigma) from the function's SUCCESS logs.
+    Used by drift checks when DRIFT_USE_BASELINE is enabled; needs at least
+    'min_samples' (default: DRIFT_BASELINE_MIN_SAMPLES) logs with non-zero vectors.
+    """
+    settings = get_weaviate_settings()
+    min_samples = settings.DRIFT_BASELINE_MIN_SAMPLES if min_samples is None else min_samples
+    collection = get_cached_client().collections.get(settings.EXECUTION_COLLECTION_NAME)
+
+    objects = collection.query.fetch_objects(
+        filters=(
+                wvc_query.Filter.by_property("function_name").equal(function_name) &
+                wvc_query.Filter.by_property("status").equal("SUCCESS")
+        ),
+        include_vector=True,
+        limit=limit
+    ).objects
+
+    vectors = [obj.vector.get("default") for obj in objects if obj.vector and obj.vector.get("default")]
+    matrix = np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1)
+    norms = np.linalg.norm(matrix, axis=1)
+    matrix = matrix[norms > 0] / norms[norms > 0, None]
+
+    if len(matrix) < min_samples:
+        logger.warning(
+            f"Only {len(matrix)} usable SUCCESS logs for '{function_name}' (need {min_samples}). "
+            f"Baseline not finalized."
+        )
+        return None
+
+    # Cosine distance to the normalized centroid, matching Weaviate's default metric
+    centroid = matrix.mean(axis=0)
+    centroid_norm = np.linalg.norm(centroid)
+    if centroid_norm == 0:
+        logger.warning(f"Inputs of '{function_name}' have no common direction. Baseline not finalized.")
+        return None
+    centroid /= centroid_norm
+    distances = 1.0 - matrix @ centroid
+
+    baseline = {
+        "version": BASELINE_VERSION,
+        "embedding": _embedding_signature(settings),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "centroid": centroid,
+        "mu": float(distances.mean()),
+        "sigma": max(float(distances.std()), _MIN_SIGMA),
+        "count": len(matrix)
+    }
+
+    baselines = _load_baselines()
+    with _baselines_lock:
+        baselines[function_name] = baseline
+        _save_baselines(baselines)
+
+    logger.info(
+        f"[{function_name}] Drift baseline finalized from {len(matrix)} logs "
+        f"(mu={baseline['mu']:.4f}, sigma={baseline['sigma']:.4f})"
+    )
+    return baseline
+
+
+def clear_baseline(function_name: str) -> bool:
+    """Removes the function's baseline so drift checks fall back to the KNN query."""
+    baselines = _load_baselines()
+    with _baselines_lock:
+        if baselines.pop(function_name, None) is None:
+            return False
+        _save_baselines(baselines)
+    return True
+
+
+def get_baseline(function_name: str) -> Optional[Dict[str, Any]]:
+    return _load_baselines().get(function_name)
+
+
+def score_against_baseline(vector, baseline: Dict[str, Any]) -> Tuple[float, float]:
+    """
+    Returns (cosine distance to the baseline centroid, z-score of that distance).
+    A zero vector has no direction and scores (0.0, 0.0).
+    """
+    v = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(v)
+    if norm == 0 or not np.isfinite(norm):
+        return 0.0, 0.0
+    distance = float(1.0 - (v @ baseline["centroid"]) / norm)
+    return distance, (distance - baseline["mu"]) / baseline["sigma"]
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import inspect
 import time
@@ -5,17 +6,24 @@ import traceback
 import json
 from functools import wraps
 from contextvars import ContextVar
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, FrozenSet
 from uuid import uuid4
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .alert.base import BaseAlerter
 from ..batch.batch import get_batch_manager
 from ..models.db_config import get_weaviate_settings, WeaviateSettings
 from .alert.factory import get_alerter
 from ..vectorizer.factory import get_vectorizer
 from ..database.db_search import check_semantic_drift
-from ..utils.context import execution_source_context
+from ..utils.context import (
+    execution_source_context, precomputed_vectors_context, last_execution_uuid_context, input_digest_context
+)
 
 # Create module-level logger
 logger = logging.getLogger(__name__)
@@ -60,25 +68,25 @@ def _mask_and_serialize(data: Any, sensitive_keys: set) -> Any:
 
 
 def _capture_span_attributes(
-        attributes_to_capture: Optional[List[str]],
+        attributes_to_capture: Optional[FrozenSet[str]],
         kwargs: Dict[str, Any],
         func_name: str,
         sensitive_keys: set
 ) -> Dict[str, Any]:
     captured_attributes = {}
-    if not attributes_to_capture:
+    if not attributes_to_capture or not kwargs:
         return captured_attributes
 
     try:
-        for attr_name in attributes_to_capture:
-            if attr_name in kwargs:
-                if attr_name.lower() in sensitive_keys:
-                    processed_value = "[MASKED]"
-                else:
-                    raw_value = kwargs[attr_name]
-                    processed_value = _mask_and_serialize(raw_value, sensitive_keys)
+        # Set intersection runs in C and only yields keys actually present in kwargs
+        for attr_name in attributes_to_capture.intersection(kwargs):
+            if attr_name.lower() in sensitive_keys:
+                processed_value = "[MASKED]"
+            else:
+                raw_value = kwargs[attr_name]
+                processed_value = _mask_and_serialize(raw_value, sensitive_keys)
 
-                captured_attributes[attr_name] = processed_value
+            captured_attributes[attr_name] = processed_value
 
     except Exception as e:
         logger.warning("Failed to capture attributes for '%s': %s", func_name, e)
@@ -188,15 +196,55 @@ def _create_input_vector_data(
     }
 
 
-def _deserialize_return_value(return_value_str: Optional[str]) -> Any:
+def get_last_execution_uuid() -> Optional[str]:
+    """
+    Returns the UUID of the execution log written by the last traced call in the current context
+    (None if that call was served from the cache). The log is queued, so flush the batch before reading it back.
+    Calls run through .batch() or asyncio.gather execute in copied contexts and do not update the caller's value.
+    """
+    return last_execution_uuid_context.get()
+
+
+def _embed_input_text(vectorizer, text: str) -> List[float]:
+    """
+    Returns the vector for the span input text, reusing one
+    precomputed by a batched call when available.
+    """
+    precomputed = precomputed_vectors_context.get()
+    if precomputed:
+        vector = precomputed.get(text)
+        if vector is not None:
+            return vector
+    return vectorizer.embed(text)
+
+
+def _should_embed_input(embed_predicate: Optional[Callable[..., bool]], func_name: str,
+                        args: tuple, kwargs: Dict[str, Any]) -> bool:
+    if embed_predicate is None:
+        return True
+    try:
+        return bool(embed_predicate(*args, **kwargs))
+    except Exception as e:
+        logger.warning(f"embed_predicate failed for '{func_name}', embedding anyway: {e}")
+        return True
+
+
+def _deserialize_return_value(return_value_str: Optional[str | bytes]) -> Any:
     """
     Attempts to deserialize a return value string (stored in DB)
     back to a Python object.
     [FIX] Now attempts json.loads for ALL strings to correctly unquote simple strings.
+    Uses orjson when installed; payloads it rejects (e.g. NaN) fall back to json.
     """
     if return_value_str is None:
         return None
 
+    if orjson is not None:
+        try:
+            return orjson.loads(return_value_str)
+        except (orjson.JSONDecodeError, TypeError):
+            pass
+
     try:
         # Try to deserialize everything (dicts, lists, and quoted strings like '"result"')
         return json.loads(return_value_str)
@@ -257,12 +305,15 @@ def trace_span(
         _func: Optional[Callable] = None,
         *,
         attributes_to_capture: Optional[List[str]] = None,
-        capture_return_value: bool = False
+        capture_return_value: bool = False,
+        embed_predicate: Optional[Callable[..., bool]] = None
 ) -> Callable:
     """
     Decorator to capture function execution as a 'span'.
     Can be used as @trace_span or @trace_span(attributes_to_capture=[...]).
+    'embed_predicate(*args, **kwargs)' returning False skips the input embedding for that call.
     """
+    capture_set = frozenset(attributes_to_capture) if attributes_to_capture else None
 
     def decorator(func: Callable) -> Callable:
 
@@ -285,12 +336,16 @@ def trace_span(
                 span_properties = None
                 vector_to_add: Optional[List[float]] = None
                 return_value_log: Optional[str] = None
+                # Set by @vectorize for its own span only; nested spans must not inherit it
+                input_digest = input_digest_context.get()
+                if input_digest is not None:
+                    input_digest_context.set(None)
 
                 captured_attributes = _capture_span_attributes(
-                    attributes_to_capture, kwargs, func.__name__, tracer.settings.sensitive_keys
+                    capture_set, kwargs, func.__name__, tracer.settings.sensitive_keys
                 )
 
-                if capture_return_value:
+                if capture_return_value and _should_embed_input(embed_predicate, func.__name__, args, kwargs):
                     vectorizer = get_vectorizer()
                     if vectorizer:
                         input_vector_data = _create_input_vector_data(
@@ -301,7 +356,7 @@ def trace_span(
                         )
                         try:
                             # If successful, this vector will be saved to the DB
-                            vector_to_add = vectorizer.embed(input_vector_data['text'])
+                            vector_to_add = _embed_input_text(vectorizer, input_vector_data['text'])
                         except Exception as ve:
                             logger.warning(f"Failed to vectorize input for '{func.__name__}' (Async): {ve}")
 
@@ -354,9 +409,13 @@ def trace_span(
                             capture_return_value=capture_return_value,
                             result=return_value_log
                         )
+                        if capture_return_value and input_digest is not None:
+                            span_properties["input_digest"] = input_digest
 
                     if tracer.settings.DRIFT_DETECTION_ENABLED and vector_to_add:
-                        is_drift, dist, nearest_id = check_semantic_drift(
+                        # Blocking DB query: run it off the event loop so concurrent spans overlap
+                        is_drift, dist, nearest_id = await asyncio.to_thread(
+                            check_semantic_drift,
                             vector=vector_to_add,
                             function_name=func.__name__,
                             threshold=tracer.settings.DRIFT_DISTANCE_THRESHOLD,
@@ -384,11 +443,14 @@ def trace_span(
 
                     if span_properties:
                         try:
+                            # The log object uses the span id as its UUID so callers can reference it without a query
                             tracer.batch.add_object(
                                 collection=tracer.settings.EXECUTION_COLLECTION_NAME,
                                 properties=span_properties,
+                                uuid=my_span_id,
                                 vector=vector_to_add
                             )
+                            last_execution_uuid_context.set(my_span_id)
                         except Exception as e:
                             logger.error("Failed to log span for '%s' (trace_id: %s): %s", func.__name__,
                                          tracer.trace_id, e)
@@ -418,12 +480,16 @@ def trace_span(
                 span_properties = None
                 vector_to_add: Optional[List[float]] = None
                 return_value_log: Optional[str] = None
+                # Set by @vectorize for its own span only; nested spans must not inherit it
+                input_digest = input_digest_context.get()
+                if input_digest is not None:
+                    input_digest_context.set(None)
 
                 captured_attributes = _capture_span_attributes(
-                    attributes_to_capture, kwargs, func.__name__, tracer.settings.sensitive_keys
+                    capture_set, kwargs, func.__name__, tracer.settings.sensitive_keys
                 )
 
-                if capture_return_value:
+                if capture_return_value and _should_embed_input(embed_predicate, func.__name__, args, kwargs):
                     vectorizer = get_vectorizer()
                     if vectorizer:
                         input_vector_data = _create_input_vector_data(
@@ -434,7 +500,7 @@ def trace_span(
                         )
                         try:
                             # If successful, this vector will be saved to the DB
-                            vector_to_add = vectorizer.embed(input_vector_data['text'])
+                            vector_to_add = _embed_input_text(vectorizer, input_vector_data['text'])
                         except Exception as ve:
                             logger.warning(f"Failed to vectorize input for '{func.__name__}': {ve}")
 
@@ -487,6 +553,8 @@ def trace_span(
                             capture_return_value=capture_return_value,
                             result=return_value_log
                         )
+                        if capture_return_value and input_digest is not None:
+                            span_properties["input_digest"] = input_digest
 
                     if tracer.settings.DRIFT_DETECTION_ENABLED and vector_to_add:
                         is_drift, dist, nearest_id = check_semantic_drift(
@@ -517,11 +585,14 @@ def trace_span(
 
                     if span_properties:
                         try:
+                            # The log object uses the span id as its UUID so callers can reference it without a query
                             tracer.batch.add_object(
                                 collection=tracer.settings.EXECUTION_COLLECTION_NAME,
                                 properties=span_properties,
+                                uuid=my_span_id,
                                 vector=vector_to_add
                             )
+                            last_execution_uuid_context.set(my_span_id)
                         except Exception as e:
                             logger.error("Failed to log span for '%s' (trace_id: %s): %s", func.__name__,
                                          tracer.trace_id, e)
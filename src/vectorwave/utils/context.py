@@ -1,4 +1,16 @@
 from contextvars import ContextVar
+from typing import Optional, Dict, List
 
 #default is realtime context
 execution_source_context: ContextVar[str] = ContextVar("execution_source", default="REALTIME")
+
+# input text -> vector, filled by batched calls so spans can skip per-call embedding
+precomputed_vectors_context: ContextVar[Optional[Dict[str, List[float]]]] = ContextVar(
+    "precomputed_vectors", default=None
+)
+
+# UUID of the execution log written by the most recent traced call in this context
+last_execution_uuid_context: ContextVar[Optional[str]] = ContextVar("last_execution_uuid", default=None)
+
+# Exact digest of the @vectorize call's input, stored on its span for the cache's digest prefilter
+input_digest_context: ContextVar[Optional[int]] = ContextVar("input_digest", default=None)
@@ -0,0 +1,14 @@
+import hashlib
+
+_BITS = 64
+
+
+def input_digest64(text: str) -> int:
+    """
+    64-bit blake2b digest of the full input text.
+    Only byte-identical inputs share a value, so it can be used as an
+    exact-match filter in front of vector search.
+    Returned as a signed int64 to fit Weaviate's INT data type.
+    """
+    value = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+    return value - (1 << _BITS) if value >= 1 << (_BITS - 1) else value
@@ -14,6 +14,7 @@ from ..database.db import get_cached_client
 from ..models.db_config import get_weaviate_settings
 from ..monitoring.tracer import _mask_and_serialize
 from .context import execution_source_context
+from .return_caching_utils import invalidate_exact_caches
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,7 @@ class VectorWaveReplayer:
             return {"error": f"Function loading failed: {e}"}
 
         is_async_func = inspect.iscoroutinefunction(target_func)
+        valid_params = self._get_valid_params(target_func)
 
         # 2. Retrieve Test Data (Priority: Golden > Standard)
         test_objects = self._fetch_test_candidates(func_short_name, limit)
@@ -77,7 +79,7 @@ class VectorWaveReplayer:
             is_golden = obj_data.get('is_golden', False)
 
             # [FIX] Extract only valid arguments for the target function
-            inputs = self._extract_inputs(raw_inputs, target_func)
+            inputs = self._extract_inputs(raw_inputs, valid_params)
 
             token = None
             try:
@@ -204,19 +206,19 @@ class VectorWaveReplayer:
 
         return candidates
 
-    def _extract_inputs(self, props: Dict[str, Any], target_func: callable) -> Dict[str, Any]:
-        """Extracts only the arguments defined in the target function's signature."""
+    def _get_valid_params(self, target_func: callable) -> Optional[frozenset]:
+        """Resolves the target function's parameter names once per replay run."""
         try:
-            sig = inspect.signature(target_func)
-            valid_params = sig.parameters.keys()
-            inputs = {}
-            for k, v in props.items():
-                if k in valid_params and v != "[MASKED]":
-                    inputs[k] = v
-            return inputs
+            return frozenset(inspect.signature(target_func).parameters)
         except Exception as e:
-            logger.warning(f"Failed to extract inputs: {e}")
+            logger.warning(f"Failed to inspect signature: {e}")
+            return None
+
+    def _extract_inputs(self, props: Dict[str, Any], valid_params: Optional[frozenset]) -> Dict[str, Any]:
+        """Extracts only the arguments defined in the target function's signature."""
+        if valid_params is None:
             return props
+        return {k: v for k, v in props.items() if k in valid_params and v != "[MASKED]"}
 
     def _deserialize_value(self, value: Any) -> Any:
         if isinstance(value, str):
@@ -249,6 +251,7 @@ class VectorWaveReplayer:
                 uuid=uuid_str,
                 properties={"return_value": str(val_str)}
             )
+            invalidate_exact_caches()
         except Exception as e:
             logger.error(f"Failed to update baseline for {uuid_str}: {e}")
 
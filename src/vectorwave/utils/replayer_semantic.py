@@ -54,6 +54,7 @@ class SemanticReplayer(VectorWaveReplayer):
             return {"error": f"Function loading failed: {e}"}
 
         is_async_func = inspect.iscoroutinefunction(target_func)
+        valid_params = self._get_valid_params(target_func)
 
         # 2. Retrieve Test Data using Parent's Logic (Golden Priority)
         test_objects = self._fetch_test_candidates(func_short_name, limit)
@@ -87,7 +88,7 @@ class SemanticReplayer(VectorWaveReplayer):
             is_golden = obj_data.get('is_golden', False)
 
             # [FIX] Extract inputs using parent method
-            inputs = self._extract_inputs(raw_inputs, target_func)
+            inputs = self._extract_inputs(raw_inputs, valid_params)
 
             try:
                 token = execution_source_context.set("REPLAY")
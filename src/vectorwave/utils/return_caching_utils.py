@@ -1,5 +1,9 @@
 import logging
-from typing import Optional, Tuple, Any, Dict, Callable
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple, Any, Dict, Callable, List
 import json
 from datetime import datetime, timezone
 from uuid import uuid4
@@ -8,38 +12,282 @@ from weaviate.util import generate_uuid5
 import weaviate.classes.query as wvc_query
 
 from ..models.db_config import get_weaviate_settings, WeaviateSettings
-from ..monitoring.tracer import _create_input_vector_data, _deserialize_return_value, current_tracer_var, \
-    current_span_id_var
+from ..monitoring.tracer import _create_input_vector_data, _deserialize_return_value, _mask_and_serialize, \
+    current_tracer_var, current_span_id_var
 from ..database.db_search import search_similar_execution
+from ..vectorizer.base import BaseVectorizer
 from ..vectorizer.factory import get_vectorizer
 from ..batch.batch import get_batch_manager
 from ..database.db import get_cached_client  # [NEW] 클라이언트 직접 접근
+from ..utils.input_digest import input_digest64
+from ..utils.context import execution_source_context
 
 logger = logging.getLogger(__name__)
 
+# Key layout of a CACHE_HIT log. Copied per hit so the hash table is pre-sized and
+# only the per-call values need to be written.
+_CACHE_HIT_TEMPLATE: Dict[str, Any] = {
+    "trace_id": None,
+    "span_id": None,
+    "parent_span_id": None,
+    "function_name": None,
+    "function_uuid": None,
+    "timestamp_utc": None,
+    "duration_ms": 0.0,
+    "status": "CACHE_HIT",
+    "return_value": None,
+    "is_golden_source": False,
+    "cache_source_uuid": None
+}
 
-def _check_and_return_cached_result(
+
+@lru_cache(maxsize=4096)
+def _embed_cached(vectorizer: BaseVectorizer, text: str) -> List[float]:
+    """
+    Memoizes input embeddings on the cache lookup path.
+    'text' already contains the function name, and the vectorizer is part of the key
+    so a re-initialized vectorizer never reuses stale vectors.
+    """
+    return vectorizer.embed(text)
+
+
+@lru_cache(maxsize=1024)
+def _func_uuid_for(func_identifier: str) -> str:
+    """Memoized generate_uuid5 for callers that don't pass a precomputed func_uuid."""
+    return generate_uuid5(func_identifier)
+
+
+# Bumped by invalidate_exact_caches(); every _ExactMatchCache drops its entries when it changes
+_exact_cache_generation = 0
+
+
+def invalidate_exact_caches() -> None:
+    """
+    Drops all exact-match memo entries. Called whenever Golden or execution data
+    that may have served a memoized result is added, updated or deleted.
+    """
+    global _exact_cache_generation
+    _exact_cache_generation += 1
+
+
+class _ExactMatchCache:
+    """
+    Process-local memo of results keyed by the exact call arguments.
+    Sits in front of the semantic cache so byte-identical calls skip embedding and vector search.
+    Entries are (cached_log, is_golden_hit) in the shape _log_cache_hit expects, and expire
+    after 'ttl_seconds' or when invalidate_exact_caches() is called.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, cached_log, is_golden_hit)
+        self._entries: "OrderedDict[tuple, Tuple[float, Dict[str, Any], bool]]" = OrderedDict()
+        self._generation = _exact_cache_generation
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Returns a hashable key for the call, or None if any argument is unhashable.
+        Argument types are part of the key, since 1, 1.0 and True compare equal.
+        """
+        key = (
+            tuple((type(a), a) for a in args),
+            tuple(sorted((k, type(v), v) for k, v in kwargs.items()))
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _drop_if_invalidated(self) -> None:
+        if self._generation != _exact_cache_generation:
+            self._entries.clear()
+            self._generation = _exact_cache_generation
+
+    def get(self, key: tuple) -> Optional[Tuple[Dict[str, Any], bool]]:
+        with self._lock:
+            self._drop_if_invalidated()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, cached_log, is_golden_hit = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return cached_log, is_golden_hit
+
+    def put(self, key: tuple, cached_log: Dict[str, Any], is_golden_hit: bool) -> None:
+        with self._lock:
+            self._drop_if_invalidated()
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, cached_log, is_golden_hit)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+def _exact_cache_enabled(exact_cache: Optional[_ExactMatchCache]) -> bool:
+    # Replays must re-execute the function, so the memo neither answers nor records them
+    return exact_cache is not None and execution_source_context.get() != "REPLAY"
+
+
+def _remember_result(
+        exact_cache: Optional[_ExactMatchCache],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        result: Any
+) -> None:
+    """
+    Stores a freshly executed result in the exact-match memo, serialized the same way
+    the tracer stores return values so hits behave like semantic cache hits.
+    """
+    if not _exact_cache_enabled(exact_cache) or result is None:
+        return
+    key = exact_cache.make_key(args, kwargs)
+    if key is None:
+        return
+    try:
+        settings = get_weaviate_settings()
+        return_value = json.dumps(_mask_and_serialize(result, settings.sensitive_keys))
+    except (TypeError, ValueError):
+        return
+    exact_cache.put(key, {'return_value': return_value, 'uuid': None}, False)
+
+
+def _find_digest_match(
+        client,
+        settings: WeaviateSettings,
+        function_name: str,
+        input_digest: int
+) -> Optional[Tuple[Dict[str, Any], bool]]:
+    """
+    Exact input-digest lookup (Golden first, then SUCCESS logs) that avoids embedding and ANN search.
+    Returns (cached_log, is_golden_hit) or None.
+    """
+    digest_filter = (
+            wvc_query.Filter.by_property("function_name").equal(function_name) &
+            wvc_query.Filter.by_property("input_digest").equal(input_digest)
+    )
+    sources = (
+        (settings.GOLDEN_COLLECTION_NAME, digest_filter, True),
+        (settings.EXECUTION_COLLECTION_NAME,
+         digest_filter & wvc_query.Filter.by_property("status").equal("SUCCESS"), False),
+    )
+    for collection_name, filters, is_golden in sources:
+        try:
+            response = client.collections.get(collection_name).query.fetch_objects(
+                filters=filters,
+                limit=1,
+                return_properties=["return_value"]
+            )
+        except Exception as e:
+            logger.debug(f"Input digest lookup on '{collection_name}' failed: {e}")
+            continue
+
+        if response.objects:
+            match = response.objects[0]
+            return {
+                'return_value': match.properties.get('return_value'),
+                'metadata': {'distance': 0.0},
+                'uuid': str(match.uuid)
+            }, is_golden
+    return None
+
+
+def _log_cache_hit(
+        settings: WeaviateSettings,
+        func: Callable,
+        function_name: str,
+        func_uuid: Optional[str],
+        cached_log: Dict[str, Any],
+        is_golden_hit: bool
+) -> None:
+    """
+    Queues a CACHE_HIT log for a served cache hit. Failures are logged, never raised.
+    """
+    try:
+        batch_manager = get_batch_manager()
+        if batch_manager is None:
+            return
+
+        tracer = current_tracer_var.get()
+        parent_span_id = current_span_id_var.get()
+        trace_id = tracer.trace_id if tracer else str(uuid4())
+
+        if func_uuid is None:
+            module_name = getattr(func, "__module__", "__main__")
+            func_uuid = _func_uuid_for(f"{module_name}.{function_name}")
+
+        hit_properties = _CACHE_HIT_TEMPLATE.copy()
+        hit_properties["trace_id"] = trace_id
+        hit_properties["span_id"] = str(uuid4())
+        hit_properties["parent_span_id"] = parent_span_id
+        hit_properties["function_name"] = function_name
+        hit_properties["function_uuid"] = func_uuid
+        hit_properties["timestamp_utc"] = datetime.now(timezone.utc).isoformat()
+        hit_properties["return_value"] = cached_log.get('return_value')
+        hit_properties["is_golden_source"] = is_golden_hit
+        hit_properties["cache_source_uuid"] = cached_log.get('uuid')
+
+        if settings.global_custom_values:
+            hit_properties.update(settings.global_custom_values)
+
+        # Add to batch (no vector: the hit references the already-indexed source record,
+        # and cache/drift/recommendation searches only consider SUCCESS logs)
+        batch_manager.add_object(
+            collection=settings.EXECUTION_COLLECTION_NAME,
+            properties=hit_properties
+        )
+
+    except Exception as log_e:
+        logger.error(f"Failed to log CACHE_HIT: {log_e}")
+
+
+def _lookup_cached_result(
         func: Callable,
         args: Tuple[Any, ...],
         kwargs: Dict[str, Any],
         function_name: str,
         cache_threshold: float,
-        is_async: bool
-) -> Optional[Any]:
+        is_async: bool,
+        func_uuid: Optional[str] = None,
+        exact_cache: Optional[_ExactMatchCache] = None
+) -> Tuple[Optional[Any], Optional[int]]:
     """
-    Checks for a cached result.
-    Priority 1: VectorWaveGoldenDataset (Golden Data)
-    Priority 2: VectorWaveExecutions (Standard Logs)
+    Checks for a cached result and returns (cached value or None, input digest or None).
+    Priority 0: exact_cache (identical arguments, no embedding or search)
+    Priority 1: input digest (CACHE_INPUT_DIGEST_PREFILTER, identical input text)
+    Priority 2: VectorWaveGoldenDataset (Golden Data)
+    Priority 3: VectorWaveExecutions (Standard Logs)
+
+    The digest is computed from the same input text that gets embedded, only after an exact_cache miss;
+    @vectorize stores it on the span of a cache miss.
+    'func_uuid' is precomputed by @vectorize at decoration time; it is derived here only when omitted.
     """
+    input_digest: Optional[int] = None
     if not cache_threshold:
-        return None
+        return None, None
 
     settings: WeaviateSettings = get_weaviate_settings()
+
+    exact_key = exact_cache.make_key(args, kwargs) if _exact_cache_enabled(exact_cache) else None
+    if exact_key is not None:
+        exact_hit = exact_cache.get(exact_key)
+        if exact_hit is not None:
+            cached_log, is_golden_hit = exact_hit
+            logger.info(f"[Cache Hit] '{function_name}' skipped (Exact Match).")
+            if settings.LOG_CACHE_HITS:
+                _log_cache_hit(settings, func, function_name, func_uuid, cached_log, is_golden_hit)
+            return _deserialize_return_value(cached_log.get('return_value')), input_digest
+
     vectorizer = get_vectorizer()
 
     if vectorizer is None:
         logger.error(f"Cannot perform vectorization for caching on '{function_name}': Vectorizer is None.")
-        return None
+        return None, None
 
     try:
         # (A) Create vectorization data
@@ -50,52 +298,62 @@ def _check_and_return_cached_result(
             sensitive_keys=settings.sensitive_keys
         )
 
-        # (B) Vectorize
-        input_vector = vectorizer.embed(input_vector_data['text'])
-
-        # (C) [NEW] Priority 1: Search Golden Dataset
         client = get_cached_client()
-        golden_match = None
+        cached_log = None
+        is_golden_hit = False
 
-        try:
-            golden_col = client.collections.get(settings.GOLDEN_COLLECTION_NAME)
-            # Golden Data search(vector similarity based)
-            response = golden_col.query.near_vector(
-                near_vector=input_vector,
-                limit=1,
-                filters=wvc_query.Filter.by_property("function_name").equal(function_name),
-                certainty=cache_threshold,
-                return_properties=["return_value", "original_uuid"],
-                return_metadata=wvc_query.MetadataQuery(distance=True, certainty=True)
-            )
+        # (A-1) Exact input-digest prefilter: identical inputs skip embedding and vector search
+        if settings.CACHE_INPUT_DIGEST_PREFILTER:
+            input_digest = input_digest64(input_vector_data['text'])
+        if input_digest is not None:
+            digest_match = _find_digest_match(client, settings, function_name, input_digest)
+            if digest_match is not None:
+                cached_log, is_golden_hit = digest_match
+                logger.info(f"[Cache Hit] '{function_name}' matched by input digest (Golden: {is_golden_hit}).")
 
-            if response.objects:
-                golden_match = response.objects[0]
-                logger.info(f"🌟 [Golden Cache Hit] '{function_name}' found in Golden Dataset. (Distance: {golden_match.metadata.distance:.4f})")
+        if cached_log is None:
+            # (B) Vectorize (memoized for repeated identical inputs)
+            input_vector = _embed_cached(vectorizer, input_vector_data['text'])
 
-        except Exception as e:
-            logger.warning(f"Golden cache search failed: {e}")
+            # (C) [NEW] Priority 1: Search Golden Dataset
+            golden_match = None
 
-        # (D) Decide Source (Golden vs Standard)
-        cached_log = None
-        is_golden_hit = False
+            try:
+                golden_col = client.collections.get(settings.GOLDEN_COLLECTION_NAME)
+                # Golden Data search(vector similarity based)
+                response = golden_col.query.near_vector(
+                    near_vector=input_vector,
+                    limit=1,
+                    filters=wvc_query.Filter.by_property("function_name").equal(function_name),
+                    certainty=cache_threshold,
+                    return_properties=["return_value", "original_uuid"],
+                    return_metadata=wvc_query.MetadataQuery(distance=True, certainty=True)
+                )
 
-        if golden_match:
-            cached_log = {
-                'return_value': golden_match.properties.get('return_value'),
-                'metadata': {
-                    'distance': golden_match.metadata.distance,
-                    'certainty': golden_match.metadata.certainty,
-                },
-                'uuid': str(golden_match.uuid)
-            }
-            is_golden_hit = True
-        else:
-            cached_log = search_similar_execution(
-                query_vector=input_vector,
-                function_name=function_name,
-                threshold=cache_threshold
-            )
+                if response.objects:
+                    golden_match = response.objects[0]
+                    logger.info(f"🌟 [Golden Cache Hit] '{function_name}' found in Golden Dataset. (Distance: {golden_match.metadata.distance:.4f})")
+
+            except Exception as e:
+                logger.warning(f"Golden cache search failed: {e}")
+
+            # (D) Decide Source (Golden vs Standard)
+            if golden_match:
+                cached_log = {
+                    'return_value': golden_match.properties.get('return_value'),
+                    'metadata': {
+                        'distance': golden_match.metadata.distance,
+                        'certainty': golden_match.metadata.certainty,
+                    },
+                    'uuid': str(golden_match.uuid)
+                }
+                is_golden_hit = True
+            else:
+                cached_log = search_similar_execution(
+                    query_vector=input_vector,
+                    function_name=function_name,
+                    threshold=cache_threshold
+                )
 
         # (E) Process Cache Hit
         if cached_log:
@@ -106,47 +364,36 @@ def _check_and_return_cached_result(
                     f"Distance: {distance:.4f}"
                 )
 
-            # (F) Log CACHE_HIT event
-            try:
-                batch_manager = get_batch_manager()
-
-                tracer = current_tracer_var.get()
-                parent_span_id = current_span_id_var.get()
-                trace_id = tracer.trace_id if tracer else str(uuid4())
-
-                module_name = getattr(func, "__module__", "__main__")
-                func_uuid = generate_uuid5(f"{module_name}.{function_name}")
-
-                hit_properties = {
-                    "trace_id": trace_id,
-                    "span_id": str(uuid4()),
-                    "parent_span_id": parent_span_id,
-                    "function_name": function_name,
-                    "function_uuid": func_uuid,
-                    "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-                    "duration_ms": 0.0,
-                    "status": "CACHE_HIT",
-                    "return_value": cached_log.get('return_value'),
-                    "is_golden_source": is_golden_hit
-                }
-
-                if settings.global_custom_values:
-                    hit_properties.update(settings.global_custom_values)
-
-                # Add to batch
-                batch_manager.add_object(
-                    collection=settings.EXECUTION_COLLECTION_NAME,
-                    properties=hit_properties,
-                    vector=input_vector
-                )
+            # (F) Log CACHE_HIT event (opt-out via LOG_CACHE_HITS)
+            if settings.LOG_CACHE_HITS:
+                _log_cache_hit(settings, func, function_name, func_uuid, cached_log, is_golden_hit)
 
-            except Exception as log_e:
-                logger.error(f"Failed to log CACHE_HIT: {log_e}")
+            if exact_key is not None:
+                exact_cache.put(exact_key, cached_log, is_golden_hit)
 
-            return _deserialize_return_value(cached_log.get('return_value'))
+            return _deserialize_return_value(cached_log.get('return_value')), input_digest
 
-        return None
+        return None, input_digest
 
     except Exception as e:
         logger.error(f"Failed to check semantic cache for '{function_name}': {e}", exc_info=True)
-        return None
\ No newline at end of file
+        return None, input_digest
+
+
+def _check_and_return_cached_result(
+        func: Callable,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        function_name: str,
+        cache_threshold: float,
+        is_async: bool,
+        func_uuid: Optional[str] = None,
+        exact_cache: Optional[_ExactMatchCache] = None
+) -> Optional[Any]:
+    """
+    Checks for a cached result (see _lookup_cached_result) and returns it, or None on a miss.
+    """
+    return _lookup_cached_result(
+        func, args, kwargs, function_name, cache_threshold, is_async,
+        func_uuid=func_uuid, exact_cache=exact_cache
+    )[0]
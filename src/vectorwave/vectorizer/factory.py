@@ -1,6 +1,7 @@
 from functools import lru_cache
 from typing import Optional
 import logging
+import threading
 from ..models.db_config import get_weaviate_settings, WeaviateSettings
 from .base import BaseVectorizer
 from .huggingface_vectorizer import HuggingFaceVectorizer
@@ -8,6 +9,10 @@ from .openai_vectorizer import OpenAIVectorizer
 
 logger = logging.getLogger(__name__)
 
+_warmup_thread: Optional[threading.Thread] = None
+# Guards the check-then-start in start_vectorizer_warmup so concurrent callers share one thread
+_warmup_lock = threading.Lock()
+
 
 @lru_cache()
 def get_vectorizer() -> Optional[BaseVectorizer]:
@@ -16,6 +21,12 @@ def get_vectorizer() -> Optional[BaseVectorizer]:
     - "weaviate_module" or "none": Returns None as Weaviate handles processing.
     - "huggingface", "openai_client": Returns the actual instance as Python handles processing.
     """
+    # A background warmup is already building the instance: wait for it and reuse its result.
+    warmup = _warmup_thread
+    if warmup is not None and warmup.is_alive() and warmup is not threading.current_thread():
+        warmup.join()
+        return get_vectorizer()
+
     settings: WeaviateSettings = get_weaviate_settings()
     vectorizer_name = settings.VECTORIZER.lower()
 
@@ -23,7 +34,11 @@ def get_vectorizer() -> Optional[BaseVectorizer]:
 
     if vectorizer_name == "huggingface":
         try:
-            return HuggingFaceVectorizer(model_name=settings.HF_MODEL_NAME)
+            return HuggingFaceVectorizer(
+                model_name=settings.HF_MODEL_NAME,
+                backend=settings.HF_BACKEND,
+                model_file_name=settings.HF_MODEL_FILE_NAME
+            )
         except Exception as e:
             logger.error("Failed to initialize HuggingFaceVectorizer: %s", e)
             return None
@@ -49,3 +64,27 @@ def get_vectorizer() -> Optional[BaseVectorizer]:
     else:
         logger.warning("Unknown VECTORIZER setting: '%s'. Disabling vectorizer.", vectorizer_name)
         return None
+
+
+def _warmup():
+    try:
+        vectorizer = get_vectorizer()
+        # Local models pay a one-time cost on their first encode; OpenAI calls are billed, so skip them.
+        if isinstance(vectorizer, HuggingFaceVectorizer):
+            vectorizer.embed("warmup")
+    except Exception as e:
+        logger.warning("Vectorizer warmup failed: %s", e)
+
+
+def start_vectorizer_warmup() -> threading.Thread:
+    """
+    Loads the configured vectorizer in a daemon thread so that model loading
+    overlaps with other startup work (e.g. the Weaviate connection).
+    The first get_vectorizer() call on another thread waits for it.
+    """
+    global _warmup_thread
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(target=_warmup, name="vectorwave-vectorizer-warmup", daemon=True)
+            _warmup_thread.start()
+        return _warmup_thread
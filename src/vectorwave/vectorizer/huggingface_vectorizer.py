@@ -1,5 +1,6 @@
 from .base import BaseVectorizer
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple, Optional
 import os
 import logging
 
@@ -15,19 +16,44 @@ except ImportError:
 class HuggingFaceVectorizer(BaseVectorizer):
     """[NEW] HuggingFace SentenceTransformer (Python Client) implementation"""
 
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, backend: str = "torch", model_file_name: Optional[str] = None):
         if SentenceTransformer is None:
             # Could not find the 'sentence-transformers' library.
             raise ImportError("Could not find the 'sentence-transformers' library.")
 
         # Force use of CPU (can be changed to 'cuda', etc., if needed)
-        self.model = SentenceTransformer(model_name, device='cpu')
-        logger.info("HuggingFaceVectorizer loaded model '%s' on CPU.", model_name)
+        self.model = self._load_model(model_name, backend, model_file_name)
+        logger.info("HuggingFaceVectorizer loaded model '%s' on CPU (backend: %s).", model_name, self.backend)
 
-    def embed(self, text: str) -> List[float]:
+        # Per-instance memo: repeated identical inputs skip tokenization and the forward pass
+        self._encode_cached = lru_cache(maxsize=4096)(self._encode_one)
+
+    def _load_model(self, model_name: str, backend: str, model_file_name: Optional[str]):
+        """
+        Loads the model with the requested backend ("torch", "onnx", "openvino").
+        The ONNX/OpenVINO backends need 'sentence-transformers[onnx]' (>= 3.2);
+        if they cannot be loaded, falls back to PyTorch.
+        """
+        backend = (backend or "torch").lower()
+        if backend != "torch":
+            model_kwargs = {"file_name": model_file_name} if model_file_name else None
+            try:
+                model = SentenceTransformer(model_name, device='cpu', backend=backend, model_kwargs=model_kwargs)
+                self.backend = backend
+                return model
+            except Exception as e:
+                logger.warning("Failed to load '%s' with backend '%s', falling back to torch: %s", model_name, backend, e)
+
+        self.backend = "torch"
+        return SentenceTransformer(model_name, device='cpu')
+
+    def _encode_one(self, text: str) -> Tuple[float, ...]:
         # convert_to_numpy=True is faster on CPU
         vector = self.model.encode([text], convert_to_numpy=True)[0]
-        return vector.tolist()
+        return tuple(vector.tolist())
+
+    def embed(self, text: str) -> List[float]:
+        return list(self._encode_cached(text))
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         vectors = self.model.encode(texts, convert_to_numpy=True)
@@ -36,6 +36,7 @@ DELAY_SECONDS = 0.5
 QUERY = "Analyze this high-cost query for a payment of 100 dollars."
 AMOUNT = 100
 NUM_RUNS = 10 # Number of runs per group
+VERBOSE = bool(os.environ.get("VW_VERBOSE"))  # Per-execution prints add stdout jitter to the timings
 
 # 4-A. Caching Enabled Group (Target for Performance Improvement)
 @vectorize(
@@ -47,7 +48,8 @@ NUM_RUNS = 10 # Number of runs per group
 )
 def heavy_cached_query(user_query: str, amount: int):
     # This log is only printed upon a cache miss (actual execution).
-    print(f"  [CACHED GROUP] 🚀 Executing (Delay: {DELAY_SECONDS:.1f}s)...")
+    if VERBOSE:
+        print(f"  [CACHED GROUP] 🚀 Executing (Delay: {DELAY_SECONDS:.1f}s)...")
     time.sleep(DELAY_SECONDS)
     return {"status": "NEW_RUN"}
 
@@ -61,7 +63,8 @@ def heavy_cached_query(user_query: str, amount: int):
 )
 def heavy_uncached_query(user_query: str, amount: int):
     # This log is printed every time since caching is disabled.
-    print(f"  [UNCACHED GROUP] ❌ Executing (Delay: {DELAY_SECONDS:.1f}s)...")
+    if VERBOSE:
+        print(f"  [UNCACHED GROUP] ❌ Executing (Delay: {DELAY_SECONDS:.1f}s)...")
     time.sleep(DELAY_SECONDS)
     return {"status": "UNCALCHED_RUN"}
 
@@ -76,16 +79,20 @@ def run_test_group(func: Callable, group_name: str, num_runs: int = NUM_RUNS) ->
     print(f"--- {group_name} Start ({num_runs} total calls, {DELAY_SECONDS:.1f} sec delay each) ---")
     print("=" * 60)
 
+    lines = []
     start_time = time.time()
 
     for i in range(num_runs):
         # Calls made with identical arguments to induce cache hits/misses.
-        print(f"  [{i+1}/{num_runs}] Calling...")
+        lines.append(f"  [{i+1}/{num_runs}] Calling...")
         func(user_query=QUERY, amount=AMOUNT)
 
     end_time = time.time()
     total_time = end_time - start_time
 
+    # Emitted after timing so stdout flushes are not counted in the comparison
+    sys.stdout.write("\n".join(lines) + "\n")
+
     print(f"\n✅ {group_name} Complete. Total execution time: {total_time:.2f} seconds")
     return total_time
 
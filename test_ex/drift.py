@@ -1,6 +1,6 @@
 import sys
 import os
-import time
+import asyncio
 import logging
 
 # --- 경로 설정 ---
@@ -12,7 +12,7 @@ os.chdir(current_script_dir)
 
 from vectorwave import vectorize, initialize_database
 from vectorwave.models.db_config import get_weaviate_settings
-from vectorwave.database.db import get_cached_client
+from vectorwave.database.db import count_objects, wait_for_indexed
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger("DriftTest")
@@ -39,7 +39,7 @@ def run_drift_test():
         team="cs-team",
         capture_return_value=True
     )
-    def product_inquiry(query: str):
+    async def product_inquiry(query: str):
         return f"Answer: {query}"
 
     # 3. 정상 데이터 학습 (Product Inquiries)
@@ -53,12 +53,14 @@ def run_drift_test():
         "Is this compatible with Mac?"
     ]
 
-    for q in normal_queries:
-        print(f"  ✅ Normal: {q}")
-        product_inquiry(query=q)
+    prev_count = count_objects(settings.EXECUTION_COLLECTION_NAME)
 
-    print("\n  ⏳ Waiting for DB indexing (10s)...")
-    time.sleep(10)
+    print("\n".join(f"  ✅ Normal: {q}" for q in normal_queries))
+    # Embeds all queries in one forward pass, then runs the calls concurrently
+    asyncio.run(product_inquiry.batch(query=normal_queries))
+
+    print("\n  ⏳ Waiting for DB indexing...")
+    wait_for_indexed(settings.EXECUTION_COLLECTION_NAME, prev_count + len(normal_queries))
 
     print("\n" + "-" * 60)
     print("[Phase 2] Injecting Anomalies (Drift Input)")
@@ -70,17 +72,18 @@ def run_drift_test():
         "I want a pepperoni pizza for lunch."     # Random (Drift)
     ]
 
-    for q in drift_queries:
-        print(f"\n  ⚠️  Testing Drift Input: {q}")
-        product_inquiry(query=q)
-        time.sleep(1)
+    # One call at a time so each '🚨 [Semantic Drift]' log follows the input that caused it
+    async def inject_drift_inputs():
+        for q in drift_queries:
+            print(f"\n  ⚠️  Testing Drift Input: {q}")
+            await product_inquiry(query=q)
+
+    asyncio.run(inject_drift_inputs())
 
     print("\n" + "=" * 60)
     print("Test Complete. Check for '🚨 [Semantic Drift]' logs above.")
     print("=" * 60)
 
-    get_cached_client().close()
-
 if __name__ == "__main__":
     from dotenv import load_dotenv
     load_dotenv()
@@ -1,6 +1,5 @@
 import sys
 import os
-import time
 import logging
 from typing import Union
 
@@ -14,6 +13,7 @@ os.chdir(current_script_dir)
 # Import VectorWave core modules and Healer
 from vectorwave import vectorize, initialize_database, generate_and_register_metadata
 from vectorwave.utils.healer import VectorWaveHealer
+from vectorwave.batch.batch import flush_pending
 # tracer is used indirectly via vectorize
 
 # Logging configuration
@@ -84,9 +84,9 @@ def run_e2e_healer_test():
             # Traceback records the TypeError
             print(f"  -> Intentional error occurred and recorded: {e.__class__.__name__}: {e}")
 
-        # Allow time for logs to be written to DB (assuming async processing)
-        print("  -> Waiting 5 seconds for log DB recording...")
-        time.sleep(5)
+        # Block until the queued logs are written to DB
+        print("  -> Flushing pending logs to DB...")
+        flush_pending(timeout=10)
 
         # 6. Execute VectorWaveHealer
         print(f"\n5. Executing VectorWaveHealer: Starting diagnosis for '{func_name}'")
@@ -11,10 +11,16 @@ sys.path.insert(0, src_path)
 os.environ["RECOMMENDATION_STEADY_MARGIN"] = "0.25"
 os.environ["RECOMMENDATION_DISCOVERY_MARGIN"] = "0.40"
 
-from vectorwave import vectorize, initialize_database
+from vectorwave import vectorize, initialize_database, get_last_execution_uuid
+from vectorwave.batch.batch import flush_pending
 from vectorwave.database.dataset import VectorWaveDatasetManager
-from vectorwave.search.execution_search import search_executions
-from vectorwave.database.db import get_cached_client
+from vectorwave.database.db import count_objects, wait_for_indexed
+
+try:
+    from tqdm import tqdm  # Installed alongside sentence-transformers
+except ImportError:
+    def tqdm(iterable, **kwargs):
+        return iterable
 
 
 
@@ -26,7 +32,6 @@ from vectorwave.database.db import get_cached_client
     capture_return_value=True
 )
 def golden_test_func(query: str):
-    print(f"  [EXEC] Processing: '{query}'")
     time.sleep(0.05)
     return f"Result: {query}"
 
@@ -56,12 +61,11 @@ def run_recommendation_test():
             print("  ⚠️ No Golden Data found. Creating a baseline...")
             baseline_query = "Standard guide for usage"
             golden_test_func(baseline_query)
-            print("  ⏳ Waiting 2s for indexing...")
-            time.sleep(2)
+            baseline_uuid = get_last_execution_uuid()
+            # Only the queued write needs to land; no search for the new log's UUID
+            flush_pending(timeout=10)
 
-            logs = search_executions(limit=1, filters={"function_name": target_func})
-            if logs:
-                dataset_manager.register_as_golden(logs[0]['uuid'], note="Baseline for test")
+            if baseline_uuid and dataset_manager.register_as_golden(baseline_uuid, note="Baseline for test"):
                 print("  ✅ Baseline registered: 'Standard guide for usage'")
             else:
                 return
@@ -93,12 +97,13 @@ def run_recommendation_test():
         "Movie review: The latest superhero film was amazing"
     ]
 
-    for i, query in enumerate(test_scenarios):
-        print(f"  ({i+1}/{len(test_scenarios)}) Generating log: '{query[:40]}...'")
+    prev_count = count_objects(settings.EXECUTION_COLLECTION_NAME)
+
+    for query in tqdm(test_scenarios, desc="  Generating logs"):
         golden_test_func(query)
 
-    print(f"  ⏳ Waiting 5s for embedding generation & indexing...")
-    time.sleep(5)
+    print(f"  ⏳ Waiting for embedding generation & indexing...")
+    wait_for_indexed(settings.EXECUTION_COLLECTION_NAME, prev_count + len(test_scenarios))
 
     # 4. 추천 실행
     print("\n[Step 3] Running Recommendation Engine...")
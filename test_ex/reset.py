@@ -18,13 +18,19 @@ def clear_database():
 
     ]
 
-    for col_name in collections:
-        try:
-            # Attempt deletion without checking if the collection exists (try-except handles errors if missing)
-            client.collections.delete(col_name)
+    try:
+        # The v4 client accepts a list and deletes all collections in one call
+        client.collections.delete(collections)
+        for col_name in collections:
             print(f"   ✅ Collection deletion complete: {col_name}")
-        except Exception as e:
-            print(f"   ⚠️ Deletion failed ({col_name}): {e}")
+    except Exception as e:
+        print(f"   ⚠️ Bulk deletion failed ({e}), retrying one by one...")
+        for col_name in collections:
+            try:
+                client.collections.delete(col_name)
+                print(f"   ✅ Collection deletion complete: {col_name}")
+            except Exception as e:
+                print(f"   ⚠️ Deletion failed ({col_name}): {e}")
 
     print("✨ DB is clean.")
 